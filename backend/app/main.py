@@ -1,36 +1,107 @@
+import asyncio
+import logging
+import queue
+from contextlib import asynccontextmanager, suppress
+from logging.handlers import QueueHandler, QueueListener
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-import sys
-import os
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
+# crud/models/database live at the backend/ root, which is on sys.path when
+# the app is started from backend/ (`uvicorn app.main:app`)
+import crud
 import models
-from database import engine
+from config import ALLOWED_ORIGINS, CREATE_TABLES
+from database import engine, SessionLocal, SessionManagerMiddleware, warm_pool
 
 # Import all routers
 from app.routers import storage, users, videos, audio, video_processing, files, video_sessions, content_generation
+from app.services.download_counter import download_counter
+from app.services.openai_service import openai_service
+from app.services.veo3_service import veo3_service
+
+logger = logging.getLogger(__name__)
+
+def warm_up():
+    """Create tables if enabled, then fill the connection pool and compile the hot list queries"""
+    if CREATE_TABLES:
+        models.Base.metadata.create_all(bind=engine)
+    warm_pool()
+    db = SessionLocal()
+    try:
+        # Compiled SQL is cached per statement shape, so one pass covers every page
+        crud.get_users(db, limit=1)
+        crud.get_videos(db, limit=1)
+        crud.get_audios(db, limit=1)
+        crud.get_files(db, limit=1)
+    except Exception:
+        logger.exception("Failed to warm up list queries")
+    finally:
+        db.close()
+
+def start_log_listener() -> QueueListener:
+    """Put the root log handlers behind a queue so request threads never wait on log I/O"""
+    root = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *(root.handlers or [logging.StreamHandler()]), respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+def stop_log_listener(listener: QueueListener) -> None:
+    """Flush queued records and hand the original handlers back to the root logger"""
+    listener.stop()
+    logging.getLogger().handlers = list(listener.handlers)
 
-models.Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    log_listener = start_log_listener()
+    await run_in_threadpool(warm_up)
+    counter_flusher = asyncio.create_task(download_counter.run())
+    yield
+    counter_flusher.cancel()
+    with suppress(asyncio.CancelledError):
+        await counter_flusher
+    # Release the long-lived provider HTTP clients
+    await openai_service.close()
+    await veo3_service.close()
+    stop_log_listener(log_listener)
 
 app = FastAPI(
     title="Hackathon Backend API", 
     description="FastAPI backend with SQLite for UQCS Hackathon 2025",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
+class AllowlistCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that checks the Origin header against a frozenset instead of scanning a list"""
+
+    def __init__(self, app, allow_origins=(), **kwargs):
+        super().__init__(app, allow_origins=allow_origins, **kwargs)
+        self.allowed_origin_set = frozenset(allow_origins)
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        return self.allow_all_origins or origin in self.allowed_origin_set
+
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:5173", "http://localhost:3000", "http://localhost:8080"],
+    AllowlistCORSMiddleware,
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
+# One scoped DB session per request, removed once the response is sent
+app.add_middleware(SessionManagerMiddleware)
+
 # Include all routers
 app.include_router(users.router)
 app.include_router(videos.router)
@@ -51,5 +122,18 @@ def health_check():
     return {"status": "healthy", "message": "API is running"}
 
 if __name__ == "__main__":
+    import os
+    import sys
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+
+    # Reload mode is single-process; otherwise run one worker per CPU on uvloop/httptools
+    reload = os.getenv("API_RELOAD", "false").lower() == "true"
+    uvicorn.run(
+        "app.main:app",
+        host=os.getenv("API_HOST", "0.0.0.0"),
+        port=int(os.getenv("API_PORT", "8000")),
+        reload=reload,
+        workers=None if reload else int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+    )
\ No newline at end of file
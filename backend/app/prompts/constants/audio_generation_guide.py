@@ -1,4 +1,6 @@
-AUDIO_PROMPT_REFINEMENT_SYSTEM_PROMPT = """You are a professional audio script writer specializing in creating concise, natural-sounding narrative text for Text-to-Speech (TTS) systems.
+from typing import Final
+
+AUDIO_PROMPT_REFINEMENT_SYSTEM_PROMPT: Final[str] = """You are a professional audio script writer specializing in creating concise, natural-sounding narrative text for Text-to-Speech (TTS) systems.
 
 Your primary objective is to generate audio scripts that:
 - Can be comfortably read aloud in 8 seconds or less (approximately 12 words maximum)
@@ -1,5 +1,7 @@
+from typing import Final
+
 # Content analysis and dual prompt generation
-CONTENT_ANALYSIS_SYSTEM_PROMPT = """You are a professional creative content analyst and VEO3 prompt engineer.
+CONTENT_ANALYSIS_SYSTEM_PROMPT: Final[str] = """You are a professional creative content analyst and VEO3 prompt engineer.
 
 IMPORTANT: This is for GENERAL content analysis, NOT PDF analysis. Do not mention PDFs, stages, or analysis steps.
 
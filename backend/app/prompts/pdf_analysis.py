@@ -2,6 +2,49 @@
 OpenAI prompts for PDF content analysis and video generation
 """
 
+from functools import lru_cache
+from typing import List
+
+def chunk_pdf_for_prompt(pdf_content: str, max_chars: int, overlap: int = 200) -> List[str]:
+    """
+    Split PDF text into chunks that fit a single analysis request
+
+    Chunks are filled up to max_chars on line boundaries, running across
+    page breaks (pdf_service's "--- Page N ---" markers stay in the text);
+    a line too long for any chunk is cut to fill the current one. Each chunk
+    after the first starts with the last `overlap` characters of the
+    previous one so context carries over.
+    
+    Args:
+        pdf_content: Combined PDF text, as produced by pdf_service
+        max_chars: Maximum characters per chunk
+        overlap: Characters repeated from the end of the previous chunk
+        
+    Returns:
+        List of chunks (a single chunk when the content already fits)
+    """
+    if len(pdf_content) <= max_chars:
+        return [pdf_content]
+
+    overlap = min(overlap, max_chars // 2)
+    chunks = []
+    current = ""
+    for line in pdf_content.replace("\f", "\n").splitlines(keepends=True):
+        while line:
+            room = max_chars - len(current)
+            if len(line) <= room:
+                current += line
+                break
+            if len(line) > max_chars - overlap:
+                current += line[:room]
+                line = line[room:]
+            chunks.append(current)
+            current = current[-overlap:] if overlap else ""
+    if current.strip():
+        chunks.append(current)
+    return chunks
+
+@lru_cache(maxsize=16)
 def get_pdf_analysis_system_prompt(category_context: str) -> str:
     """
     Get PDF analysis system prompt with category context
@@ -12,8 +55,9 @@ def get_pdf_analysis_system_prompt(category_context: str) -> str:
     Returns:
         Formatted system prompt string
     """
-    return f"""You are a professional creative content analyst and VEO3 prompt engineer specializing in document-based video creation. {category_context}
-
+    # Static instructions come first so OpenAI's automatic prompt caching can
+    # reuse the prefix across categories; the category context goes last
+    return f"""You are a professional creative content analyst and VEO3 prompt engineer specializing in document-based video creation.
 
 Your task is to:
 1. Analyze the provided PDF content and user instructions
@@ -47,7 +91,10 @@ Guidelines:
 - Transform PDF text content into specific visual scenes and objects
 - Include exact names, dates, facts from documents as visual elements
 - Make abstract concepts concrete and visually representable
-- Ensure video prompt can generate a scene that communicates the PDF's core message"""
+- Ensure video prompt can generate a scene that communicates the PDF's core message
+
+### Category-Specific Context:
+{category_context}"""
 
 def get_pdf_analysis_user_message(user_prompt: str, pdf_content: str) -> str:
     """
@@ -60,9 +107,9 @@ def get_pdf_analysis_user_message(user_prompt: str, pdf_content: str) -> str:
     Returns:
         Formatted user message string
     """
-    return f"""User Instructions: {user_prompt}
+    return f"""Please analyze this content using the two-stage process and generate video/audio prompts that transform the PDF information into visual storytelling. Every key element from your analysis must appear in the final video prompt.
 
-PDF Content to Analyze:
-{pdf_content}
+User Instructions: {user_prompt}
 
-Please analyze this content using the two-stage process and generate video/audio prompts that transform the PDF information into visual storytelling. Every key element from your analysis must appear in the final video prompt."""
\ No newline at end of file
+PDF Content to Analyze:
+{pdf_content}"""
\ No newline at end of file
@@ -2,6 +2,20 @@
 Prompts for refining video and audio prompts based on user feedback
 """
 
+# Static templates; the original prompt stays ahead of the feedback so the
+# start of the message is shared across turns of a refinement loop
+VIDEO_REFINEMENT_TEMPLATE = """Original prompt: {original_prompt}
+
+User feedback: {user_feedback}
+
+Please provide the optimized video generation prompt."""
+
+AUDIO_REFINEMENT_TEMPLATE = """Original audio text: {original_prompt}
+
+User feedback: {user_feedback}
+
+Please provide the optimized audio generation text."""
+
 def get_video_refinement_user_message(original_prompt: str, user_feedback: str) -> str:
     """
     Format user message for video prompt refinement
@@ -13,11 +27,10 @@ def get_video_refinement_user_message(original_prompt: str, user_feedback: str)
     Returns:
         Formatted user message string
     """
-    return f"""Original prompt: {original_prompt}
-
-User feedback: {user_feedback}
-
-Please provide the optimized video generation prompt."""
+    return VIDEO_REFINEMENT_TEMPLATE.format_map({
+        "original_prompt": original_prompt,
+        "user_feedback": user_feedback
+    })
 
 def get_audio_refinement_user_message(original_prompt: str, user_feedback: str) -> str:
     """
@@ -30,8 +43,7 @@ def get_audio_refinement_user_message(original_prompt: str, user_feedback: str)
     Returns:
         Formatted user message string
     """
-    return f"""Original audio text: {original_prompt}
-
-User feedback: {user_feedback}
-
-Please provide the optimized audio generation text."""
\ No newline at end of file
+    return AUDIO_REFINEMENT_TEMPLATE.format_map({
+        "original_prompt": original_prompt,
+        "user_feedback": user_feedback
+    })
\ No newline at end of file
@@ -1,17 +1,16 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Request
+from fastapi.responses import FileResponse, Response
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-import sys
-import os
-
-# Add parent directories to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import hashlib
+import aiofiles.os
+import orjson
 
 import crud
-import models
 import schemas
-from database import get_db
+from config import ENABLE_RESPONSE_VALIDATION
+from database import get_db, db_session
 from app.services.audio_service import audio_service
 
 router = APIRouter(
@@ -20,6 +19,29 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Error details shared by the handlers (see users.py)
+AUDIO_NOT_FOUND = "Audio not found"
+AUDIO_NOT_READY = "Audio not ready for download"
+AUDIO_FILE_NOT_FOUND = "Audio file not found"
+
+class AudioFileResponse(FileResponse):
+    """
+    FileResponse with 1MB reads instead of Starlette's 64KB default, so large
+    WAV/MP3 downloads make far fewer trips through the Python send loop.
+    Servers offering the http.response.pathsend extension still get zero-copy.
+    """
+    chunk_size = 1024 * 1024
+
+def _etag_json_response(request: Request, body: bytes, cache_control: str, headers: Optional[dict] = None) -> Response:
+    """
+    JSON response tagged with an ETag of its body; answers 304 with no body
+    when the client's If-None-Match already names this version
+    """
+    headers = {**(headers or {}), "ETag": f'"{hashlib.md5(body).hexdigest()}"', "Cache-Control": cache_control}
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 @router.post("/synthesize", response_model=schemas.Audio)
 async def synthesize_audio(
     audio: schemas.AudioCreate,
@@ -36,59 +58,105 @@ async def synthesize_audio(
         raise HTTPException(status_code=500, detail=f"TTS synthesis failed: {str(e)}")
 
 @router.get("/", response_model=List[schemas.Audio])
-def read_audios(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+async def read_audios(request: Request, response: Response, skip: int = 0, limit: int = 100, after_id: Optional[int] = None):
     """
-    Get list of audio synthesis requests
+    Get list of audio synthesis requests; pass `after_id` (the previous
+    page's X-Next-Cursor) for keyset pagination
     """
-    audios = crud.get_audios(db, skip=skip, limit=limit)
-    return audios
+    audios = await run_in_threadpool(crud.get_audios, db_session, skip=skip, limit=limit, after_id=after_id)
+    headers = schemas.next_cursor_headers(audios, limit)
+    if ENABLE_RESPONSE_VALIDATION:
+        response.headers.update(headers)
+        return audios
+    # Rows change while synthesis runs, so clients revalidate every time but skip unchanged bodies
+    return _etag_json_response(request, schemas.dump_orm_list_json(schemas.Audio, audios), "private, no-cache", headers)
+
+# Static paths must be registered before /{audio_id} or they are matched as an id
+@router.get("/voices")
+async def get_available_voices(request: Request, language_code: Optional[str] = None):
+    """
+    Get list of available voices from Google Cloud TTS
+    
+    Sends an ETag so clients can revalidate with If-None-Match and skip the body
+    """
+    try:
+        voices = await run_in_threadpool(audio_service.get_available_voices, language_code)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get voices: {str(e)}")
+    
+    return _etag_json_response(request, orjson.dumps({"voices": voices}), "public, max-age=3600")
 
 @router.get("/{audio_id}", response_model=schemas.Audio)
-def read_audio(audio_id: int, db: Session = Depends(get_db)):
+async def read_audio(request: Request, audio_id: int):
     """
     Get audio synthesis request by ID
     """
-    db_audio = crud.get_audio(db, audio_id=audio_id)
+    db_audio = await run_in_threadpool(crud.get_audio, db_session, audio_id=audio_id)
     if db_audio is None:
-        raise HTTPException(status_code=404, detail="Audio not found")
-    return db_audio
+        raise HTTPException(status_code=404, detail=AUDIO_NOT_FOUND)
+    # Clients usually download right after reading the row
+    crud.cache_audio_download(db_audio)
+    if ENABLE_RESPONSE_VALIDATION:
+        return db_audio
+    return _etag_json_response(request, schemas.dump_orm_json(schemas.Audio, db_audio).encode(), "private, no-cache")
 
 @router.get("/user/{user_email}", response_model=List[schemas.Audio])
-def read_audios_by_user(user_email: str, db: Session = Depends(get_db)):
+async def read_audios_by_user(
+    response: Response,
+    user_email: str,
+    skip: int = 0,
+    limit: int = 100,
+    after_id: Optional[int] = None
+):
     """
-    Get audio synthesis requests by user email
+    Get audio synthesis requests by user email; pages like GET /audio/
     """
-    audios = crud.get_audios_by_user_email(db, user_email=user_email)
-    return audios
+    audios = await run_in_threadpool(
+        crud.get_audios_by_user_email, db_session,
+        user_email=user_email, skip=skip, limit=limit, after_id=after_id
+    )
+    headers = schemas.next_cursor_headers(audios, limit)
+    if ENABLE_RESPONSE_VALIDATION:
+        response.headers.update(headers)
+        return audios
+    return Response(content=schemas.dump_orm_list_json(schemas.Audio, audios), media_type="application/json", headers=headers)
 
 @router.get("/{audio_id}/download")
-def download_audio(audio_id: int, db: Session = Depends(get_db)):
+async def download_audio(request: Request, audio_id: int):
     """
     Download the generated audio file
     """
-    db_audio = crud.get_audio(db, audio_id=audio_id)
-    if db_audio is None:
-        raise HTTPException(status_code=404, detail="Audio not found")
+    download_info = crud.get_cached_audio_download(audio_id)
+    if download_info is None:
+        db_audio = await run_in_threadpool(crud.get_audio, db_session, audio_id=audio_id)
+        if db_audio is None:
+            raise HTTPException(status_code=404, detail=AUDIO_NOT_FOUND)
+        
+        download_info = crud.cache_audio_download(db_audio)
+        if download_info is None:
+            raise HTTPException(status_code=400, detail=AUDIO_NOT_READY)
+    
+    file_path, audio_format = download_info
     
-    if db_audio.status != models.AudioStatus.COMPLETED:
-        raise HTTPException(status_code=400, detail="Audio not ready for download")
+    # Single stat doubles as the existence check and is handed to the response;
+    # run it off the event loop so a slow filesystem doesn't stall other requests
+    try:
+        file_stat = await aiofiles.os.stat(file_path)
+    except (FileNotFoundError, TypeError):
+        raise HTTPException(status_code=404, detail=AUDIO_FILE_NOT_FOUND)
     
-    if not db_audio.file_path or not os.path.exists(db_audio.file_path):
-        raise HTTPException(status_code=404, detail="Audio file not found")
+    # Generated audio is rewritten rather than edited in place, so id + mtime + size identify a version
+    version = f"{audio_id}:{file_stat.st_mtime}:{file_stat.st_size}"
+    etag = f'"{hashlib.md5(version.encode()).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=3600"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
     
-    return FileResponse(
-        path=db_audio.file_path,
-        filename=f"audio_{audio_id}.{db_audio.audio_format.lower()}",
-        media_type=f"audio/{db_audio.audio_format.lower()}"
+    extension = audio_format.lower()
+    return AudioFileResponse(
+        path=file_path,
+        filename=f"audio_{audio_id}.{extension}",
+        media_type=f"audio/{extension}",
+        headers=headers,
+        stat_result=file_stat
     )
-
-@router.get("/voices")
-def get_available_voices(language_code: Optional[str] = None):
-    """
-    Get list of available voices from Google Cloud TTS
-    """
-    try:
-        voices = audio_service.get_available_voices(language_code)
-        return {"voices": voices}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get voices: {str(e)}")
\ No newline at end of file
@@ -1,13 +1,14 @@
-from typing import Optional
+import asyncio
+import logging
+from functools import lru_cache
+from typing import AsyncIterator, Optional
+import orjson
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
-import sys
-import os
-
-# Add parent directories to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from config import ENABLE_RESPONSE_VALIDATION, OPENAI_REQUEST_TIMEOUT, OPENAI_REQUEST_RETRIES, VEO3_REQUEST_TIMEOUT
 from database import get_db
 from app.services.openai_service import openai_service
 from app.services.veo3_service import veo3_service
@@ -18,6 +19,8 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+logger = logging.getLogger(__name__)
+
 # Request/Response Models
 class ContentAnalysisRequest(BaseModel):
     user_input: str = Field(..., description="User's input text/prompt", min_length=1, max_length=5000)
@@ -29,16 +32,25 @@ class PromptAnalysis(BaseModel):
     style_preference: str
     mood: str
 
+class TokenUsage(BaseModel):
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+    cached_tokens: int = 0
+
 class ContentAnalysisResponse(BaseModel):
     success: bool
     analysis: Optional[PromptAnalysis] = None
     video_prompt: Optional[str] = None
     audio_prompt: Optional[str] = None
     raw_response: Optional[str] = None
-    usage: Optional[dict] = None
+    usage: Optional[TokenUsage] = None
     warning: Optional[str] = None
     error: Optional[str] = None
 
+class ContentAnalysisBatchRequest(BaseModel):
+    items: list[ContentAnalysisRequest] = Field(..., description="Inputs to analyze concurrently", min_length=1, max_length=10)
+
 class PromptRefinementRequest(BaseModel):
     original_prompt: str = Field(..., description="Original prompt to refine", min_length=1)
     user_feedback: str = Field(..., description="User feedback for refinement", min_length=1, max_length=1000)
@@ -49,6 +61,7 @@ class PromptRefinementResponse(BaseModel):
     refined_prompt: Optional[str] = None
     original_prompt: Optional[str] = None
     user_feedback: Optional[str] = None
+    usage: Optional[TokenUsage] = None
     error: Optional[str] = None
 
 class VideoGenerationRequest(BaseModel):
@@ -85,7 +98,68 @@ class CompleteWorkflowResponse(BaseModel):
     video_generation: Optional[VideoGenerationResponse] = None
     error: Optional[str] = None
 
-@router.post("/analyze", response_model=ContentAnalysisResponse)
+async def _with_timeout(make_call, timeout: float, retries: int = 0):
+    """
+    Await make_call() bounded by timeout, retrying timed out attempts with
+    exponential backoff (1s, 2s, ...); re-raises asyncio.TimeoutError
+    once the retries are used up
+    """
+    for attempt in range(retries + 1):
+        try:
+            return await asyncio.wait_for(make_call(), timeout=timeout)
+        except asyncio.TimeoutError:
+            if attempt == retries:
+                raise
+            logger.warning("Provider call timed out after %ss, retrying (attempt %d)", timeout, attempt + 2)
+            await asyncio.sleep(2 ** attempt)
+
+def _openai_call(make_call):
+    """Run an OpenAI service call with the configured timeout and retries"""
+    return _with_timeout(make_call, OPENAI_REQUEST_TIMEOUT, OPENAI_REQUEST_RETRIES)
+
+def _sse_response(chunks: AsyncIterator[str]) -> StreamingResponse:
+    """
+    Relay text chunks as Server-Sent Events: one `data: {"delta": ...}` frame
+    per chunk, then a `done` event (or an `error` event if the stream fails)
+    """
+    async def events():
+        try:
+            async for text in chunks:
+                yield b"data: " + orjson.dumps({"delta": text}) + b"\n\n"
+        except Exception as e:
+            yield b"event: error\ndata: " + orjson.dumps({"error": str(e)}) + b"\n\n"
+            return
+        yield b"event: done\ndata: {}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def _model_response(model: BaseModel):
+    """
+    Serialize a response model the handler already validated while building
+    it, instead of letting FastAPI validate it against response_model again
+    """
+    if ENABLE_RESPONSE_VALIDATION:
+        return model
+    return Response(content=model.model_dump_json(exclude_none=True), media_type="application/json")
+
+def _build_analysis_response(result: dict) -> ContentAnalysisResponse:
+    """Structure a successful OpenAI analysis result as a response model"""
+    data = result["data"]
+    return ContentAnalysisResponse(
+        success=True,
+        analysis=PromptAnalysis(**data["analysis"]) if data and "analysis" in data else None,
+        video_prompt=data.get("video_prompt") if data else None,
+        audio_prompt=data.get("audio_prompt") if data else None,
+        raw_response=result.get("raw_response"),
+        usage=result.get("usage"),
+        warning=result.get("warning")
+    )
+
+@router.post("/analyze", response_model=ContentAnalysisResponse, response_model_exclude_none=True)
 async def analyze_content_and_generate_prompts(
     request: ContentAnalysisRequest,
     db: Session = Depends(get_db)
@@ -101,10 +175,10 @@ async def analyze_content_and_generate_prompts(
     """
     try:
         # Call OpenAI service to analyze and generate prompts
-        result = await openai_service.analyze_and_generate_prompts(
+        result = await _openai_call(lambda: openai_service.analyze_and_generate_prompts(
             user_input=request.user_input,
             user_context=request.user_context
-        )
+        ))
         
         if not result["success"]:
             raise HTTPException(
@@ -112,31 +186,70 @@ async def analyze_content_and_generate_prompts(
                 detail=f"Failed to analyze content: {result.get('error', 'Unknown error')}"
             )
         
-        # Extract data from result
-        data = result["data"]
-        
-        # Structure the response
-        response = ContentAnalysisResponse(
-            success=True,
-            analysis=PromptAnalysis(**data["analysis"]) if data and "analysis" in data else None,
-            video_prompt=data.get("video_prompt") if data else None,
-            audio_prompt=data.get("audio_prompt") if data else None,
-            raw_response=result.get("raw_response"),
-            usage=result.get("usage"),
-            warning=result.get("warning")
-        )
-        
-        return response
+        return _model_response(_build_analysis_response(result))
         
     except HTTPException:
         raise
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="Content analysis timed out")
     except Exception as e:
         raise HTTPException(
             status_code=500, 
             detail=f"Internal server error during content analysis: {str(e)}"
         )
 
-@router.post("/refine-prompt", response_model=PromptRefinementResponse)
+@router.post("/analyze/stream")
+async def analyze_content_stream(request: ContentAnalysisRequest):
+    """
+    Same analysis as /analyze, streamed as Server-Sent Events
+
+    The model's JSON output arrives in `delta` pieces; clients concatenate
+    them and parse the JSON after the `done` event
+    """
+    return _sse_response(openai_service.analyze_and_generate_prompts_stream(
+        user_input=request.user_input,
+        user_context=request.user_context
+    ))
+
+@router.post("/analyze-batch", response_model=list[ContentAnalysisResponse], response_model_exclude_none=True)
+async def analyze_content_batch(
+    request: ContentAnalysisBatchRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Analyze several inputs at once, running the OpenAI calls concurrently
+    
+    Each item gets its own response; a failed item does not fail the batch
+    """
+    results = await asyncio.gather(*(
+        _openai_call(lambda item=item: openai_service.analyze_and_generate_prompts(
+            user_input=item.user_input,
+            user_context=item.user_context
+        ))
+        for item in request.items
+    ), return_exceptions=True)
+    
+    responses = []
+    for result in results:
+        if isinstance(result, asyncio.TimeoutError):
+            responses.append(ContentAnalysisResponse(success=False, error="Content analysis timed out"))
+            continue
+        if isinstance(result, BaseException):
+            responses.append(ContentAnalysisResponse(success=False, error=str(result)))
+            continue
+        if not result["success"]:
+            responses.append(ContentAnalysisResponse(
+                success=False,
+                error=f"Failed to analyze content: {result.get('error', 'Unknown error')}"
+            ))
+            continue
+        try:
+            responses.append(_build_analysis_response(result))
+        except Exception as e:
+            responses.append(ContentAnalysisResponse(success=False, error=str(e)))
+    return responses
+
+@router.post("/refine-prompt", response_model=PromptRefinementResponse, response_model_exclude_none=True)
 async def refine_prompt(
     request: PromptRefinementRequest,
     db: Session = Depends(get_db)
@@ -156,15 +269,15 @@ async def refine_prompt(
         
         # Call appropriate refinement service
         if request.prompt_type == "video":
-            result = await openai_service.refine_video_prompt(
+            result = await _openai_call(lambda: openai_service.refine_video_prompt(
                 original_prompt=request.original_prompt,
                 user_feedback=request.user_feedback
-            )
+            ))
         else:  # audio
-            result = await openai_service.refine_audio_prompt(
+            result = await _openai_call(lambda: openai_service.refine_audio_prompt(
                 original_prompt=request.original_prompt,
                 user_feedback=request.user_feedback
-            )
+            ))
         
         if not result["success"]:
             raise HTTPException(
@@ -176,18 +289,38 @@ async def refine_prompt(
             success=True,
             refined_prompt=result["refined_prompt"],
             original_prompt=result["original_prompt"],
-            user_feedback=result["user_feedback"]
+            user_feedback=result["user_feedback"],
+            usage=result.get("usage")
         )
         
     except HTTPException:
         raise
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="Prompt refinement timed out")
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Internal server error during prompt refinement: {str(e)}"
         )
 
-@router.post("/generate-video", response_model=VideoGenerationResponse)
+@router.post("/refine-prompt/stream")
+async def refine_prompt_stream(request: PromptRefinementRequest):
+    """
+    Same refinement as /refine-prompt, streamed as Server-Sent Events
+    """
+    if request.prompt_type not in ["video", "audio"]:
+        raise HTTPException(
+            status_code=400,
+            detail="prompt_type must be either 'video' or 'audio'"
+        )
+
+    return _sse_response(openai_service.refine_prompt_stream(
+        prompt_type=request.prompt_type,
+        original_prompt=request.original_prompt,
+        user_feedback=request.user_feedback
+    ))
+
+@router.post("/generate-video", response_model=VideoGenerationResponse, response_model_exclude_none=True)
 async def generate_video_only(
     request: VideoGenerationRequest,
     db: Session = Depends(get_db)
@@ -198,16 +331,25 @@ async def generate_video_only(
     This endpoint takes a video prompt and generates a video using VEO3 API
     """
     try:
-        result = await veo3_service.generate_video_complete(
-            prompt=request.video_prompt,
-            output_video_id=request.output_video_id,
-            model=request.model,
-            enhance_prompt=request.enhance_prompt,
-            image_url=request.image_url
+        result = await asyncio.wait_for(
+            veo3_service.generate_video_complete(
+                prompt=request.video_prompt,
+                output_video_id=request.output_video_id,
+                model=request.model,
+                enhance_prompt=request.enhance_prompt,
+                image_url=request.image_url
+            ),
+            timeout=VEO3_REQUEST_TIMEOUT
         )
         
         return VideoGenerationResponse(**result)
         
+    except asyncio.TimeoutError:
+        return VideoGenerationResponse(
+            success=False,
+            error=f"Video generation timed out after {VEO3_REQUEST_TIMEOUT} seconds",
+            video_id=request.output_video_id
+        )
     except Exception as e:
         return VideoGenerationResponse(
             success=False,
@@ -215,7 +357,7 @@ async def generate_video_only(
             video_id=request.output_video_id
         )
 
-@router.post("/complete-workflow", response_model=CompleteWorkflowResponse)
+@router.post("/complete-workflow", response_model=CompleteWorkflowResponse, response_model_exclude_none=True)
 async def complete_content_generation_workflow(
     request: CompleteWorkflowRequest,
     db: Session = Depends(get_db)
@@ -230,10 +372,14 @@ async def complete_content_generation_workflow(
     4. Returns both prompts and video generation result
     """
     try:
-        # Step 1: Analyze content and generate prompts
-        analysis_result = await openai_service.analyze_and_generate_prompts(
-            user_input=request.user_input,
-            user_context=request.user_context
+        # Step 1: Analyze content and generate prompts, warming up the VEO3
+        # connection in the meantime so generation can start right away
+        analysis_result, _ = await asyncio.gather(
+            _openai_call(lambda: openai_service.analyze_and_generate_prompts(
+                user_input=request.user_input,
+                user_context=request.user_context
+            )),
+            veo3_service.prewarm()
         )
         
         if not analysis_result["success"]:
@@ -253,12 +399,15 @@ async def complete_content_generation_workflow(
             )
         
         # Step 2: Generate video using VEO3
-        video_result = await veo3_service.generate_video_complete(
-            prompt=video_prompt,
-            output_video_id=request.output_video_id,
-            model=request.veo3_model,
-            enhance_prompt=request.enhance_prompt,
-            image_url=request.image_url
+        video_result = await asyncio.wait_for(
+            veo3_service.generate_video_complete(
+                prompt=video_prompt,
+                output_video_id=request.output_video_id,
+                model=request.veo3_model,
+                enhance_prompt=request.enhance_prompt,
+                image_url=request.image_url
+            ),
+            timeout=VEO3_REQUEST_TIMEOUT
         )
         
         # Prepare response
@@ -273,54 +422,67 @@ async def complete_content_generation_workflow(
         if not video_result["success"]:
             response.error = f"Video generation failed: {video_result.get('error', 'Unknown error')}"
         
-        return response
+        return _model_response(response)
         
+    except asyncio.TimeoutError:
+        return CompleteWorkflowResponse(
+            success=False,
+            error="Complete workflow timed out waiting on a provider"
+        )
     except Exception as e:
         return CompleteWorkflowResponse(
             success=False,
             error=f"Complete workflow failed: {str(e)}"
         )
 
+@lru_cache(maxsize=1)
+def _health_status() -> dict:
+    """
+    Build the health payload once; it only depends on API keys and settings
+    read from the environment when the services were created
+    """
+    # Test OpenAI service
+    openai_healthy = bool(openai_service.api_key)
+    
+    # Test VEO3 service
+    veo3_healthy = bool(veo3_service.api_key)
+    
+    if openai_healthy and veo3_healthy:
+        status = "healthy"
+        message = "All content generation services are operational"
+    elif openai_healthy:
+        status = "partial"
+        message = "OpenAI service operational, VEO3 service not configured"
+    elif veo3_healthy:
+        status = "partial"
+        message = "VEO3 service operational, OpenAI service not configured"
+    else:
+        status = "unhealthy"
+        message = "No services configured properly"
+    
+    return {
+        "status": status,
+        "message": message,
+        "service": "content-generation",
+        "services": {
+            "openai": {
+                "configured": openai_healthy,
+                "model": openai_service.model if openai_healthy else None
+            },
+            "veo3": {
+                "configured": veo3_healthy,
+                "base_url": veo3_service.base_url if veo3_healthy else None
+            }
+        }
+    }
+
 @router.get("/health")
 async def health_check():
     """
     Health check endpoint for content generation service
     """
     try:
-        # Test OpenAI service
-        openai_healthy = bool(openai_service.api_key)
-        
-        # Test VEO3 service
-        veo3_healthy = bool(veo3_service.api_key)
-        
-        if openai_healthy and veo3_healthy:
-            status = "healthy"
-            message = "All content generation services are operational"
-        elif openai_healthy:
-            status = "partial"
-            message = "OpenAI service operational, VEO3 service not configured"
-        elif veo3_healthy:
-            status = "partial"
-            message = "VEO3 service operational, OpenAI service not configured"
-        else:
-            status = "unhealthy"
-            message = "No services configured properly"
-        
-        return {
-            "status": status,
-            "message": message,
-            "service": "content-generation",
-            "services": {
-                "openai": {
-                    "configured": openai_healthy,
-                    "model": openai_service.model if openai_healthy else None
-                },
-                "veo3": {
-                    "configured": veo3_healthy,
-                    "base_url": veo3_service.base_url if veo3_healthy else None
-                }
-            }
-        }
+        return _health_status()
         
     except Exception as e:
         return {
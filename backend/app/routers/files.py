@@ -1,25 +1,97 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile, File, Form
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
+from fastapi.routing import APIRoute
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
-import sys
-import os
-
-# Add parent directories to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import asyncio
+import logging
 
 import crud
 import models
 import schemas
+from config import (
+    ENABLE_RESPONSE_VALIDATION,
+    MAX_FILE_SIZE,
+    MAX_UPLOAD_REQUEST_SIZE,
+    UPLOAD_CONCURRENCY_LIMIT,
+    UPLOAD_SLOT_TIMEOUT,
+)
 from database import get_db
 from app.services.storage_service import storage_service
+from app.services.download_counter import download_counter
+
+UPLOAD_TOO_LARGE = f"Upload exceeds the {MAX_UPLOAD_REQUEST_SIZE} byte request limit"
+FILE_TOO_LARGE = f"File exceeds the {MAX_FILE_SIZE} byte size limit"
+
+class SizeLimitedRoute(APIRoute):
+    """
+    Route that rejects request bodies over MAX_UPLOAD_REQUEST_SIZE with a 413 before
+    the multipart parser spools them: up front from Content-Length, or as chunks
+    arrive for chunked uploads
+    """
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def size_limited_handler(request: Request):
+            content_length = request.headers.get("content-length")
+            if content_length and content_length.isdigit() and int(content_length) > MAX_UPLOAD_REQUEST_SIZE:
+                raise HTTPException(status_code=413, detail=UPLOAD_TOO_LARGE)
+
+            receive = request.receive
+            received = 0
+
+            async def size_limited_receive():
+                nonlocal received
+                message = await receive()
+                received += len(message.get("body", b""))
+                if received > MAX_UPLOAD_REQUEST_SIZE:
+                    raise HTTPException(status_code=413, detail=UPLOAD_TOO_LARGE)
+                return message
+
+            return await handler(Request(request.scope, size_limited_receive))
+
+        return size_limited_handler
 
 router = APIRouter(
     prefix="/files",
     tags=["File Management"],
     responses={404: {"description": "Not found"}},
+    route_class=SizeLimitedRoute,
 )
 
+logger = logging.getLogger(__name__)
+
+# Storage returns categories as plain strings; map them with a dict lookup per file
+_CATEGORY_BY_VALUE = {category.value: category for category in models.FileCategory}
+
+# Worker-wide cap on parallel GCS uploads, so concurrent batches can't exhaust
+# the client's HTTP pool or trip GCS rate limits
+UPLOAD_SEMAPHORE = asyncio.Semaphore(UPLOAD_CONCURRENCY_LIMIT)
+
+UPLOADS_BUSY = "Too many uploads in progress, try again shortly"
+
+async def _upload_to_gcs(file: UploadFile, user_email: Optional[str]) -> dict:
+    """Stream an upload to GCS once a slot is free; raises a 503 if none frees up in time"""
+    # Reject oversize files before they take an upload slot
+    if file.size is not None and file.size > MAX_FILE_SIZE:
+        raise HTTPException(status_code=413, detail=FILE_TOO_LARGE)
+    try:
+        await asyncio.wait_for(UPLOAD_SEMAPHORE.acquire(), timeout=UPLOAD_SLOT_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=503, detail=UPLOADS_BUSY)
+    try:
+        # Stream the spooled upload without reading it into memory
+        return await storage_service.upload_file(
+            file.file, 
+            file.filename, 
+            user_email
+        )
+    finally:
+        UPLOAD_SEMAPHORE.release()
+
 @router.post("/upload", response_model=schemas.FileUploadResponse)
 async def upload_file(
     file: UploadFile = File(...),
@@ -33,15 +105,7 @@ async def upload_file(
     Upload file to Google Cloud Storage
     """
     try:
-        # Read file content
-        file_content = await file.read()
-        
-        # Upload to GCS
-        gcs_info = await storage_service.upload_file(
-            file_content, 
-            file.filename, 
-            user_email
-        )
+        gcs_info = await _upload_to_gcs(file, user_email)
         
         # Create database record
         file_data = {
@@ -52,26 +116,24 @@ async def upload_file(
             "bucket_name": gcs_info["bucket_name"],
             "file_size": gcs_info["size"],
             "content_type": gcs_info["content_type"],
-            "category": models.FileCategory(gcs_info["category"]),
+            "category": _CATEGORY_BY_VALUE[gcs_info["category"]],
             "status": models.FileStatus.COMPLETED,
             "public_url": gcs_info["public_url"],
             "gcs_path": gcs_info["gcs_filename"],
+            "md5_hash": gcs_info.get("md5_hash"),
             "description": description,
             "tags": tags,
             "video_session_id": video_session_id
         }
         
-        db_file = crud.create_file(db, file_data)
+        db_file = await run_in_threadpool(crud.create_file, db, file_data)
         
         # Update video session file count if session is provided
         if video_session_id:
             try:
-                session = crud.get_video_session(db, video_session_id)
-                if session:
-                    total_files = crud.get_files_count_by_video_session(db, video_session_id)
-                    crud.update_video_session(db, video_session_id, schemas.VideoSessionUpdate(total_files=total_files))
+                await run_in_threadpool(crud.increment_session_file_count, db, video_session_id, 1)
             except Exception as e:
-                print(f"Warning: Could not update session file count: {e}")
+                logger.warning("Could not update session file count: %s", e)
         
         return schemas.FileUploadResponse(
             id=db_file.id,
@@ -85,6 +147,8 @@ async def upload_file(
             message="File uploaded successfully"
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"File upload failed: {str(e)}")
 
@@ -99,18 +163,20 @@ async def upload_multiple_files(
     Upload multiple files to Google Cloud Storage
     """
     try:
-        uploaded_files = []
+        results = await asyncio.gather(
+            *(_upload_to_gcs(file, user_email) for file in files),
+            return_exceptions=True
+        )
         
-        for file in files:
-            file_content = await file.read()
-            
-            gcs_info = await storage_service.upload_file(
-                file_content, 
-                file.filename, 
-                user_email
-            )
-            
-            file_data = {
+        # A failed file doesn't discard the ones that made it to GCS
+        files_data = []
+        failed_files = []
+        for file, gcs_info in zip(files, results):
+            if isinstance(gcs_info, BaseException):
+                error = gcs_info.detail if isinstance(gcs_info, HTTPException) else str(gcs_info)
+                failed_files.append({"filename": file.filename, "error": error})
+                continue
+            files_data.append({
                 "user_email": user_email,
                 "video_session_id": video_session_id,
                 "original_filename": gcs_info["original_filename"],
@@ -118,40 +184,56 @@ async def upload_multiple_files(
                 "bucket_name": gcs_info["bucket_name"],
                 "file_size": gcs_info["size"],
                 "content_type": gcs_info["content_type"],
-                "category": models.FileCategory(gcs_info["category"]),
+                "category": _CATEGORY_BY_VALUE[gcs_info["category"]],
                 "status": models.FileStatus.COMPLETED,
                 "public_url": gcs_info["public_url"],
-                "gcs_path": gcs_info["gcs_filename"]
-            }
-            
-            db_file = crud.create_file(db, file_data)
-            uploaded_files.append({
-                "id": db_file.id,
-                "filename": db_file.original_filename,
-                "size": db_file.file_size,
-                "status": "uploaded"
+                "gcs_path": gcs_info["gcs_filename"],
+                "md5_hash": gcs_info.get("md5_hash")
             })
         
-        # Update video session file count if session is provided
+        if not files_data:
+            # Every file hit the same busy/too-large error: report it as-is
+            first = results[0]
+            if (
+                isinstance(first, HTTPException)
+                and first.detail in (UPLOADS_BUSY, FILE_TOO_LARGE)
+                and all(isinstance(result, HTTPException) and result.detail == first.detail for result in results)
+            ):
+                raise HTTPException(status_code=first.status_code, detail=first.detail)
+            raise HTTPException(status_code=500, detail=f"Multiple file upload failed: {failed_files}")
+        
+        # One INSERT for the whole batch instead of a commit per file
+        file_ids = await run_in_threadpool(crud.create_files, db, files_data)
+        uploaded_files = [
+            {
+                "id": file_id,
+                "filename": file_data["original_filename"],
+                "size": file_data["file_size"],
+                "status": "uploaded"
+            }
+            for file_id, file_data in zip(file_ids, files_data)
+        ]
+        
+        # Bump the session file count once for the whole batch
         if video_session_id:
             try:
-                session = crud.get_video_session(db, video_session_id)
-                if session:
-                    total_files = crud.get_files_count_by_video_session(db, video_session_id)
-                    crud.update_video_session(db, video_session_id, schemas.VideoSessionUpdate(total_files=total_files))
+                await run_in_threadpool(crud.increment_session_file_count, db, video_session_id, len(file_ids))
             except Exception as e:
-                print(f"Warning: Could not update session file count: {e}")
+                logger.warning("Could not update session file count: %s", e)
         
         return {
             "message": f"Successfully uploaded {len(uploaded_files)} files",
-            "files": uploaded_files
+            "files": uploaded_files,
+            "failed": failed_files
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Multiple file upload failed: {str(e)}")
 
 @router.get("/{file_id}/download", response_model=schemas.FileDownloadResponse)
-async def get_download_url(
+def get_download_url(
     file_id: int,
     expiration_minutes: int = 60,
     db: Session = Depends(get_db)
@@ -170,8 +252,8 @@ async def get_download_url(
             expiration_minutes
         )
         
-        # Update download count
-        crud.update_file_download_count(db, file_id)
+        # Download counts are buffered and written in batches
+        download_counter.record(file_id)
         
         expires_at = datetime.utcnow() + timedelta(minutes=expiration_minutes)
         
@@ -184,43 +266,52 @@ async def get_download_url(
             content_type=db_file.content_type
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate download URL: {str(e)}")
 
 @router.get("/", response_model=schemas.FileList)
-async def list_files(
+def list_files(
+    response: Response,
     skip: int = 0,
     limit: int = 50,
     user_email: Optional[str] = None,
     category: Optional[models.FileCategory] = None,
+    after_id: Optional[int] = None,
     db: Session = Depends(get_db)
 ):
     """
-    List files with pagination and filters
+    List files with pagination and filters; pass `after_id` (the previous page's X-Next-Cursor) for keyset pagination
     """
     try:
-        if user_email:
-            files = crud.get_files_by_user(db, user_email, skip, limit)
-            total = crud.get_files_count_by_user(db, user_email)
-        elif category:
-            files = crud.get_files_by_category(db, category, skip, limit)
-            total = crud.get_files_count(db)  # Simplified - could add category count
-        else:
-            files = crud.get_files(db, skip, limit)
-            total = crud.get_files_count(db)
+        # Page and total come back from the same SELECT via COUNT(*) OVER ()
+        files, total = crud.get_files_page(db, skip, limit, user_email=user_email, category=category, after_id=after_id)
+        page = skip // limit + 1 if after_id is None else None
+        headers = schemas.next_cursor_headers(files, limit)
         
-        return schemas.FileList(
-            files=files,
-            total=total,
-            page=skip // limit + 1,
-            per_page=limit
+        if ENABLE_RESPONSE_VALIDATION:
+            response.headers.update(headers)
+            return schemas.FileList(
+                files=files,
+                total=total,
+                page=page,
+                per_page=limit
+            )
+        return Response(
+            content=schemas.dump_orm_page_json(
+                schemas.FileList, "files", schemas.File, files,
+                total=total, page=page, per_page=limit
+            ),
+            media_type="application/json",
+            headers=headers
         )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list files: {str(e)}")
 
 @router.get("/{file_id}", response_model=schemas.File)
-async def get_file_info(file_id: int, db: Session = Depends(get_db)):
+def get_file_info(file_id: int, db: Session = Depends(get_db)):
     """
     Get file information by ID
     """
@@ -230,7 +321,7 @@ async def get_file_info(file_id: int, db: Session = Depends(get_db)):
     return db_file
 
 @router.put("/{file_id}", response_model=schemas.File)
-async def update_file_info(
+def update_file_info(
     file_id: int,
     file_update: schemas.FileUpdate,
     db: Session = Depends(get_db)
@@ -244,7 +335,7 @@ async def update_file_info(
     return db_file
 
 @router.delete("/{file_id}")
-async def delete_file(file_id: int, db: Session = Depends(get_db)):
+def delete_file(file_id: int, db: Session = Depends(get_db)):
     """
     Delete file from both GCS and database
     """
@@ -261,5 +352,7 @@ async def delete_file(file_id: int, db: Session = Depends(get_db)):
         
         return {"message": "File deleted successfully"}
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to delete file: {str(e)}")
\ No newline at end of file
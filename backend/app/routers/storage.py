@@ -1,6 +1,10 @@
+import asyncio
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 from typing import List, Optional
+
+from config import ENABLE_RESPONSE_VALIDATION
 from app.services.storage_service import storage_service
 
 router = APIRouter(prefix="/storage", tags=["storage"])
@@ -27,19 +31,23 @@ class GetUploadUrlsResponse(BaseModel):
     urls: List[SignedUrlResponseItem]
 
 @router.post("/upload-urls", response_model=GetUploadUrlsResponse)
-def get_signed_upload_urls(payload: GetUploadUrlsRequest):
+async def get_signed_upload_urls(payload: GetUploadUrlsRequest):
     try:
-        urls: List[SignedUrlResponseItem] = []
-        for f in payload.files:
-            # 生成签名URL并把 user_id 传进去
-            signed = storage_service.generate_signed_upload_url(
+        # 每个签名都是阻塞的 RSA 计算，放到线程池里并发执行
+        signed_list = await asyncio.gather(*(
+            asyncio.to_thread(
+                storage_service.generate_signed_upload_url,
                 original_filename=f.fileName,
                 file_size=f.size,
                 content_type=f.contentType or "application/octet-stream",
                 user_id=payload.userId,
             )
-            # 将后端字段名映射为前端期望的命名
-            urls.append(SignedUrlResponseItem(
+            for f in payload.files
+        ))
+        # 将后端字段名映射为前端期望的命名；签名结果由服务端生成，关闭响应校验时跳过逐项校验
+        item_factory = SignedUrlResponseItem if ENABLE_RESPONSE_VALIDATION else SignedUrlResponseItem.model_construct
+        urls: List[SignedUrlResponseItem] = [
+            item_factory(
                 fileName=signed["original_filename"],
                 gcsFileName=signed["gcs_filename"],
                 url=signed["url"],
@@ -47,8 +55,15 @@ def get_signed_upload_urls(payload: GetUploadUrlsRequest):
                 headers=signed["headers"],
                 expiresAt=signed["expiresAt"],
                 bucket=signed["bucket_name"],
-            ))
-        return GetUploadUrlsResponse(urls=urls)
+            )
+            for signed in signed_list
+        ]
+        if ENABLE_RESPONSE_VALIDATION:
+            return GetUploadUrlsResponse(urls=urls)
+        return Response(
+            content=GetUploadUrlsResponse.model_construct(urls=urls).model_dump_json(),
+            media_type="application/json"
+        )
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=str(ve))
     except Exception as e:
@@ -1,15 +1,12 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-import sys
-import os
-
-# Add parent directories to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
 
 import crud
 import schemas
-from database import get_db
+from config import ENABLE_RESPONSE_VALIDATION
+from database import db_session
 
 router = APIRouter(
     prefix="/users",
@@ -17,24 +14,35 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Error details shared by the handlers. Each raise builds its own HTTPException,
+# since a shared instance would carry one request's traceback into the next.
+EMAIL_ALREADY_REGISTERED = "Email already registered"
+USER_NOT_FOUND = "User not found"
+
 @router.post("/", response_model=schemas.User)
-def create_user(user: schemas.UserCreate, db: Session = Depends(get_db)):
+def create_user(user: schemas.UserCreate):
     """Create a new user"""
-    db_user = crud.get_user_by_email(db, email=user.email)
+    db_user = crud.get_user_by_email(db_session, email=user.email)
     if db_user:
-        raise HTTPException(status_code=400, detail="Email already registered")
-    return crud.create_user(db=db, user=user)
+        raise HTTPException(status_code=400, detail=EMAIL_ALREADY_REGISTERED)
+    return crud.create_user(db=db_session, user=user)
 
 @router.get("/", response_model=List[schemas.User])
-def read_users(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """Get list of users with pagination"""
-    users = crud.get_users(db, skip=skip, limit=limit)
-    return users
+async def read_users(response: Response, skip: int = 0, limit: int = 100, after_id: Optional[int] = None):
+    """Get list of users; pass `after_id` (the previous page's X-Next-Cursor) for keyset pagination"""
+    users = await run_in_threadpool(crud.get_users, db_session, skip=skip, limit=limit, after_id=after_id)
+    headers = schemas.next_cursor_headers(users, limit)
+    if ENABLE_RESPONSE_VALIDATION:
+        response.headers.update(headers)
+        return users
+    return Response(content=schemas.dump_orm_list_json(schemas.User, users), media_type="application/json", headers=headers)
 
 @router.get("/{user_id}", response_model=schemas.User)
-def read_user(user_id: int, db: Session = Depends(get_db)):
+async def read_user(user_id: int):
     """Get user by ID"""
-    db_user = crud.get_user(db, user_id=user_id)
+    db_user = await run_in_threadpool(crud.get_user, db_session, user_id=user_id)
     if db_user is None:
-        raise HTTPException(status_code=404, detail="User not found")
-    return db_user
\ No newline at end of file
+        raise HTTPException(status_code=404, detail=USER_NOT_FOUND)
+    if ENABLE_RESPONSE_VALIDATION:
+        return db_user
+    return Response(content=schemas.dump_orm_json(schemas.User, db_user), media_type="application/json")
\ No newline at end of file
@@ -1,13 +1,15 @@
+import asyncio
+import logging
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-import sys
-import os
 
-# Add parent directories to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
-from database import get_db
+import crud
+import schemas
+from models import ProcessingTaskStatus
+from config import FFMPEG_MAX_JOBS, get_processed_video_path
+from database import get_db, db_session, SessionLocal
 from app.services.video_service import video_service
 from app.services.audio_video_service import audio_video_service
 
@@ -17,85 +19,140 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-@router.post("/merge")
+logger = logging.getLogger(__name__)
+
+# Queued jobs wait here (still QUEUED) on the event loop, not in a thread, until a
+# slot frees up. The limit is per worker process (see FFMPEG_MAX_JOBS)
+_ffmpeg_slots = asyncio.Semaphore(FFMPEG_MAX_JOBS)
+
+def _execute_processing_task(task_id: str, task_name: str, func, *args) -> None:
+    """Run a blocking FFmpeg job, recording its status"""
+    db = SessionLocal()
+    try:
+        crud.update_processing_task(db, task_id, schemas.ProcessingTaskUpdate(status=ProcessingTaskStatus.RUNNING))
+        try:
+            output_path = func(*args)
+        except Exception as e:
+            logger.error(f"{task_name} failed: {e}")
+            crud.update_processing_task(db, task_id, schemas.ProcessingTaskUpdate(status=ProcessingTaskStatus.FAILED, error=str(e)))
+            return
+        logger.info(f"{task_name} completed: {output_path}")
+        crud.update_processing_task(db, task_id, schemas.ProcessingTaskUpdate(status=ProcessingTaskStatus.COMPLETED, output_path=output_path))
+    finally:
+        db.close()
+
+async def _run_processing_task(task_id: str, task_name: str, func, *args) -> None:
+    """Run a queued FFmpeg job after the response has been sent, once a slot is free"""
+    async with _ffmpeg_slots:
+        await asyncio.to_thread(_execute_processing_task, task_id, task_name, func, *args)
+
+async def _queue_processing_task(background_tasks: BackgroundTasks, task_name: str, func, *args) -> str:
+    """Record a queued task and schedule it; returns the task id clients poll with"""
+    db_task = await run_in_threadpool(crud.create_processing_task, db_session, task_name)
+    background_tasks.add_task(_run_processing_task, db_task.id, task_name, func, *args)
+    return db_task.id
+
+@router.post("/merge", status_code=202)
 async def merge_videos(
     video_paths: List[str],
     output_video_id: int,
+    background_tasks: BackgroundTasks,
     with_transitions: bool = False,
     transition_duration: float = 0.5
 ):
     """
-    Merge multiple videos into one
+    Queue merging multiple videos into one
     """
-    try:
-        if with_transitions:
-            output_path = video_service.merge_videos_with_transition(
-                video_paths, output_video_id, transition_duration
-            )
-        else:
-            output_path = video_service.merge_videos(video_paths, output_video_id)
-        
-        return {
-            "message": "Videos merged successfully",
-            "output_path": output_path,
-            "video_id": output_video_id
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Video merge failed: {str(e)}")
+    if with_transitions:
+        task_id = await _queue_processing_task(
+            background_tasks, "Video merge",
+            video_service.merge_videos_with_transition,
+            video_paths, output_video_id, transition_duration
+        )
+    else:
+        task_id = await _queue_processing_task(
+            background_tasks, "Video merge",
+            video_service.merge_videos,
+            video_paths, output_video_id
+        )
+    
+    return {
+        "message": "Video merge queued",
+        "task_id": task_id,
+        "status": "queued",
+        "output_path": get_processed_video_path(output_video_id),
+        "video_id": output_video_id
+    }
 
-@router.post("/add-audio")
+@router.post("/add-audio", status_code=202)
 async def add_audio_to_video(
     video_path: str,
     audio_path: str,
     output_video_id: int,
+    background_tasks: BackgroundTasks,
     replace_audio: bool = False,
     audio_start_time: float = 0.0,
     video_start_time: float = 0.0
 ):
     """
-    Add or replace audio in a video file
+    Queue adding or replacing audio in a video file
     """
-    try:
-        if replace_audio:
-            output_path = audio_video_service.replace_audio_in_video(
-                video_path, audio_path, output_video_id
-            )
-        else:
-            output_path = audio_video_service.merge_audio_with_video(
-                video_path, audio_path, output_video_id, audio_start_time, video_start_time
-            )
-        
-        return {
-            "message": "Audio added to video successfully",
-            "output_path": output_path,
-            "video_id": output_video_id
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Audio-video merge failed: {str(e)}")
+    if replace_audio:
+        task_id = await _queue_processing_task(
+            background_tasks, "Audio replacement",
+            audio_video_service.replace_audio_in_video,
+            video_path, audio_path, output_video_id
+        )
+    else:
+        task_id = await _queue_processing_task(
+            background_tasks, "Audio-video merge",
+            audio_video_service.merge_audio_with_video,
+            video_path, audio_path, output_video_id, audio_start_time, video_start_time
+        )
+    
+    return {
+        "message": "Audio-video merge queued",
+        "task_id": task_id,
+        "status": "queued",
+        "output_path": get_processed_video_path(output_video_id),
+        "video_id": output_video_id
+    }
 
-@router.post("/background-music")
+@router.post("/background-music", status_code=202)
 async def add_background_music(
     video_path: str,
     music_path: str,
     output_video_id: int,
+    background_tasks: BackgroundTasks,
     music_volume: float = 0.3,
     original_volume: float = 1.0
 ):
     """
-    Add background music to video while preserving original audio
+    Queue adding background music to video while preserving original audio
     """
-    try:
-        output_path = audio_video_service.add_background_music(
-            video_path, music_path, output_video_id, music_volume, original_volume
-        )
-        
-        return {
-            "message": "Background music added successfully",
-            "output_path": output_path,
-            "video_id": output_video_id
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Background music addition failed: {str(e)}")
+    task_id = await _queue_processing_task(
+        background_tasks, "Background music",
+        audio_video_service.add_background_music,
+        video_path, music_path, output_video_id, music_volume, original_volume
+    )
+    
+    return {
+        "message": "Background music queued",
+        "task_id": task_id,
+        "status": "queued",
+        "output_path": get_processed_video_path(output_video_id),
+        "video_id": output_video_id
+    }
+
+@router.get("/tasks/{task_id}", response_model=schemas.ProcessingTask)
+async def get_processing_task(task_id: str):
+    """
+    Poll the status of a queued processing task
+    """
+    db_task = await run_in_threadpool(crud.get_processing_task, db_session, task_id)
+    if db_task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return db_task
 
 @router.post("/extract-audio")
 async def extract_audio_from_video(
@@ -107,9 +164,11 @@ async def extract_audio_from_video(
     Extract audio track from video file
     """
     try:
-        output_path = audio_video_service.extract_audio_from_video(
-            video_path, output_audio_id, audio_format
-        )
+        async with _ffmpeg_slots:
+            output_path = await asyncio.to_thread(
+                audio_video_service.extract_audio_from_video,
+                video_path, output_audio_id, audio_format
+            )
         
         return {
             "message": "Audio extracted successfully",
@@ -125,7 +184,7 @@ async def get_video_info(video_path: str):
     Get video file information (duration, resolution, etc.)
     """
     try:
-        info = video_service.get_video_info(video_path)
+        info = await asyncio.to_thread(video_service.get_video_info, video_path)
         return {"video_info": info}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get video info: {str(e)}")
\ No newline at end of file
@@ -1,15 +1,13 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Form
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
-import sys
-import os
-
-# Add parent directories to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 import crud
 import models
 import schemas
+from config import ENABLE_RESPONSE_VALIDATION
 from database import get_db
 
 router = APIRouter(
@@ -19,7 +17,7 @@ router = APIRouter(
 )
 
 @router.post("/", response_model=schemas.VideoSession)
-async def create_video_session(
+def create_video_session(
     user_id: int = Form(...),
     session_name: Optional[str] = Form(None),
     user_prompt: Optional[str] = Form(None),
@@ -55,35 +53,44 @@ async def create_video_session(
         raise HTTPException(status_code=500, detail=f"Failed to create video session: {str(e)}")
 
 @router.get("/", response_model=schemas.VideoSessionList)
-async def list_video_sessions(
+def list_video_sessions(
+    response: Response,
     skip: int = 0,
     limit: int = 50,
     user_id: Optional[int] = None,
+    after_id: Optional[int] = None,
     db: Session = Depends(get_db)
 ):
     """
-    List video sessions with pagination and optional user filter
+    List video sessions with pagination and optional user filter; pages by `after_id` like GET /files/
     """
     try:
-        if user_id:
-            sessions = crud.get_video_sessions_by_user(db, user_id, skip, limit)
-            total = crud.get_video_sessions_count_by_user(db, user_id)
-        else:
-            sessions = crud.get_video_sessions(db, skip, limit)
-            total = crud.get_video_sessions_count(db)
+        sessions, total = crud.get_video_sessions_page(db, skip, limit, user_id=user_id, after_id=after_id)
+        page = skip // limit + 1 if after_id is None else None
+        headers = schemas.next_cursor_headers(sessions, limit)
         
-        return schemas.VideoSessionList(
-            sessions=sessions,
-            total=total,
-            page=skip // limit + 1,
-            per_page=limit
+        if ENABLE_RESPONSE_VALIDATION:
+            response.headers.update(headers)
+            return schemas.VideoSessionList(
+                sessions=sessions,
+                total=total,
+                page=page,
+                per_page=limit
+            )
+        return Response(
+            content=schemas.dump_orm_page_json(
+                schemas.VideoSessionList, "sessions", schemas.VideoSession, sessions,
+                total=total, page=page, per_page=limit
+            ),
+            media_type="application/json",
+            headers=headers
         )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list video sessions: {str(e)}")
 
 @router.get("/{session_id}", response_model=schemas.VideoSession)
-async def get_video_session(session_id: int, db: Session = Depends(get_db)):
+def get_video_session(session_id: int, db: Session = Depends(get_db)):
     """
     Get video session by ID
     """
@@ -93,7 +100,7 @@ async def get_video_session(session_id: int, db: Session = Depends(get_db)):
     return db_session
 
 @router.put("/{session_id}", response_model=schemas.VideoSession)
-async def update_video_session(
+def update_video_session(
     session_id: int,
     session_update: schemas.VideoSessionUpdate,
     db: Session = Depends(get_db)
@@ -107,7 +114,7 @@ async def update_video_session(
     return db_session
 
 @router.delete("/{session_id}")
-async def delete_video_session(session_id: int, db: Session = Depends(get_db)):
+def delete_video_session(session_id: int, db: Session = Depends(get_db)):
     """
     Delete video session
     """
@@ -117,31 +124,44 @@ async def delete_video_session(session_id: int, db: Session = Depends(get_db)):
     return {"message": "Video session deleted successfully"}
 
 @router.get("/{session_id}/files", response_model=schemas.FileList)
-async def get_session_files(
+def get_session_files(
+    response: Response,
     session_id: int,
     skip: int = 0,
     limit: int = 50,
+    after_id: Optional[int] = None,
     db: Session = Depends(get_db)
 ):
     """
-    Get files associated with a video session
+    Get files associated with a video session; pages by `after_id` like GET /files/
     """
     try:
-        # Check if session exists
-        db_session = crud.get_video_session(db, session_id)
-        if not db_session:
+        files, total = crud.get_files_page_by_video_session(db, session_id, skip, limit, after_id=after_id)
+        # Only an empty page needs to tell a missing session apart from one with no files
+        if not files and not crud.video_session_exists(db, session_id):
             raise HTTPException(status_code=404, detail="Video session not found")
+        page = skip // limit + 1 if after_id is None else None
+        headers = schemas.next_cursor_headers(files, limit)
         
-        files = crud.get_files_by_video_session(db, session_id, skip, limit)
-        total = crud.get_files_count_by_video_session(db, session_id)
-        
-        return schemas.FileList(
-            files=files,
-            total=total,
-            page=skip // limit + 1,
-            per_page=limit
+        if ENABLE_RESPONSE_VALIDATION:
+            response.headers.update(headers)
+            return schemas.FileList(
+                files=files,
+                total=total,
+                page=page,
+                per_page=limit
+            )
+        return Response(
+            content=schemas.dump_orm_page_json(
+                schemas.FileList, "files", schemas.File, files,
+                total=total, page=page, per_page=limit
+            ),
+            media_type="application/json",
+            headers=headers
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get session files: {str(e)}")
 
@@ -156,7 +176,7 @@ async def start_session_processing(
     Start video processing for a session, optionally updating user prompt and category
     """
     try:
-        db_session = crud.get_video_session(db, session_id)
+        db_session = await run_in_threadpool(crud.get_video_session, db, session_id)
         if not db_session:
             raise HTTPException(status_code=404, detail="Video session not found")
         
@@ -174,7 +194,7 @@ async def start_session_processing(
             category=video_category,
             status=models.VideoSessionStatus.PROCESSING
         )
-        updated_session = crud.update_video_session(db, session_id, update_data)
+        updated_session = await run_in_threadpool(crud.update_video_session, db, session_id, update_data)
         
         # Import and trigger AI processing pipeline
         from app.services.ai_processor import ai_processor
@@ -192,7 +212,7 @@ async def start_session_processing(
             if not veo3_inputs["success"]:
                 # Update session status to failed if VEO3 input extraction fails
                 failed_update = schemas.VideoSessionUpdate(status=models.VideoSessionStatus.FAILED)
-                crud.update_video_session(db, session_id, failed_update)
+                await run_in_threadpool(crud.update_video_session, db, session_id, failed_update)
                 
                 return {
                     "message": "VEO3 input extraction failed",
@@ -215,7 +235,7 @@ async def start_session_processing(
             if not veo3_processing_result["success"]:
                 # Update session status to failed if video generation fails
                 failed_update = schemas.VideoSessionUpdate(status=models.VideoSessionStatus.FAILED)
-                crud.update_video_session(db, session_id, failed_update)
+                await run_in_threadpool(crud.update_video_session, db, session_id, failed_update)
 
                 return {
                     "message": "Video generation failed",
@@ -232,7 +252,7 @@ async def start_session_processing(
                 output_video_path=veo3_processing_result["output_path"],
                 video_url=veo3_processing_result["video_url"]
             )
-            final_session = crud.update_video_session(db, session_id, completed_update)
+            final_session = await run_in_threadpool(crud.update_video_session, db, session_id, completed_update)
 
             return {
                 "message": "Video processing completed successfully",
@@ -294,7 +314,7 @@ async def start_session_processing(
         except Exception as ai_error:
             # If AI processing fails, update session status to failed
             failed_update = schemas.VideoSessionUpdate(status=models.VideoSessionStatus.FAILED)
-            crud.update_video_session(db, session_id, failed_update)
+            await run_in_threadpool(crud.update_video_session, db, session_id, failed_update)
             
             return {
                 "message": "Video processing failed",
@@ -357,7 +377,7 @@ def extract_veo3_inputs(ai_results: dict) -> dict:
 
 
 @router.post("/{session_id}/complete")
-async def complete_session(
+def complete_session(
     session_id: int,
     output_video_path: Optional[str] = Form(None),
     db: Session = Depends(get_db)
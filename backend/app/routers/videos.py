@@ -1,15 +1,12 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-import sys
-import os
-
-# Add parent directories to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
 
 import crud
 import schemas
-from database import get_db
+from config import ENABLE_RESPONSE_VALIDATION
+from database import db_session
 
 router = APIRouter(
     prefix="/videos",
@@ -17,43 +14,57 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Error details shared by the handlers (see users.py)
+VIDEO_NOT_FOUND = "Video not found"
+VIDEO_TASK_NOT_FOUND = "Video task not found"
+
 @router.post("/", response_model=schemas.Video)
-def create_video(video: schemas.VideoCreate, db: Session = Depends(get_db)):
+def create_video(video: schemas.VideoCreate):
     """Create a new video"""
-    return crud.create_video(db=db, video=video)
+    return crud.create_video(db=db_session, video=video)
 
 @router.get("/", response_model=List[schemas.Video])
-def read_videos(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """Get list of videos with pagination"""
-    videos = crud.get_videos(db, skip=skip, limit=limit)
-    return videos
+async def read_videos(response: Response, skip: int = 0, limit: int = 100, after_id: Optional[int] = None):
+    """Get list of videos; pass `after_id` (the previous page's X-Next-Cursor) for keyset pagination"""
+    videos = await run_in_threadpool(crud.get_videos, db_session, skip=skip, limit=limit, after_id=after_id)
+    headers = schemas.next_cursor_headers(videos, limit)
+    if ENABLE_RESPONSE_VALIDATION:
+        response.headers.update(headers)
+        return videos
+    return Response(content=schemas.dump_orm_list_json(schemas.Video, videos), media_type="application/json", headers=headers)
 
 @router.get("/{video_id}", response_model=schemas.Video)
-def read_video(video_id: int, db: Session = Depends(get_db)):
+async def read_video(video_id: int):
     """Get video by ID"""
-    db_video = crud.get_video(db, video_id=video_id)
+    db_video = await run_in_threadpool(crud.get_video, db_session, video_id=video_id)
     if db_video is None:
-        raise HTTPException(status_code=404, detail="Video not found")
-    return db_video
+        raise HTTPException(status_code=404, detail=VIDEO_NOT_FOUND)
+    if ENABLE_RESPONSE_VALIDATION:
+        return db_video
+    return Response(content=schemas.dump_orm_json(schemas.Video, db_video), media_type="application/json")
 
 @router.get("/user/{user_email}", response_model=List[schemas.Video])
-def read_videos_by_user(user_email: str, db: Session = Depends(get_db)):
+async def read_videos_by_user(user_email: str):
     """Get videos by user email"""
-    videos = crud.get_videos_by_user_email(db, user_email=user_email)
-    return videos
+    videos = await run_in_threadpool(crud.get_videos_by_user_email, db_session, user_email=user_email)
+    if ENABLE_RESPONSE_VALIDATION:
+        return videos
+    return Response(content=schemas.dump_orm_list_json(schemas.Video, videos), media_type="application/json")
 
 @router.get("/task/{video_task_id}", response_model=schemas.Video)
-def read_video_by_task_id(video_task_id: str, db: Session = Depends(get_db)):
+async def read_video_by_task_id(video_task_id: str):
     """Get video by task ID"""
-    db_video = crud.get_video_by_task_id(db, video_task_id=video_task_id)
+    db_video = await run_in_threadpool(crud.get_video_by_task_id, db_session, video_task_id=video_task_id)
     if db_video is None:
-        raise HTTPException(status_code=404, detail="Video task not found")
-    return db_video
+        raise HTTPException(status_code=404, detail=VIDEO_TASK_NOT_FOUND)
+    if ENABLE_RESPONSE_VALIDATION:
+        return db_video
+    return Response(content=schemas.dump_orm_json(schemas.Video, db_video), media_type="application/json")
 
 @router.put("/{video_id}", response_model=schemas.Video)
-def update_video(video_id: int, video_update: schemas.VideoUpdate, db: Session = Depends(get_db)):
+def update_video(video_id: int, video_update: schemas.VideoUpdate):
     """Update video information"""
-    db_video = crud.update_video(db, video_id=video_id, video_update=video_update)
+    db_video = crud.update_video(db_session, video_id=video_id, video_update=video_update)
     if db_video is None:
-        raise HTTPException(status_code=404, detail="Video not found")
+        raise HTTPException(status_code=404, detail=VIDEO_NOT_FOUND)
     return db_video
\ No newline at end of file
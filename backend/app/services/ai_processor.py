@@ -1,16 +1,11 @@
 import logging
 from typing import Dict, Any, Optional
 from datetime import datetime
-import sys
-import os
-
-# Add parent directories to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 import models
 import crud
 import schemas
-from database import get_db
+from database import db_session
 from sqlalchemy.orm import Session
 from .pdf_service import pdf_service
 from .openai_service import openai_service
@@ -50,8 +45,8 @@ class AIProcessor:
         try:
             logger.info(f"Starting AI processing for session {session_id}")
             
-            # Get database session
-            db = next(get_db())
+            # Reuse the current request's database session
+            db = db_session()
             
             # Get video session details
             session = crud.get_video_session(db, session_id)
@@ -114,7 +109,9 @@ class AIProcessor:
             
             # Update session status to failed
             try:
-                db = next(get_db())
+                db = db_session()
+                # The request's session may be mid-way through a failed transaction
+                db.rollback()
                 update_data = schemas.VideoSessionUpdate(status=models.VideoSessionStatus.FAILED)
                 crud.update_video_session(db, session_id, update_data)
             except Exception as update_error:
@@ -242,7 +239,7 @@ class AIProcessor:
     ) -> Dict[str, Any]:
         """Update video session with processing results"""
         try:
-            db = next(get_db())
+            db = db_session()
             
             # Determine session status
             if (pdf_results["status"] == "success" and 
@@ -285,7 +282,7 @@ class AIProcessor:
     async def get_processing_status(self, session_id: int) -> Dict[str, Any]:
         """Get current processing status of a video session"""
         try:
-            db = next(get_db())
+            db = db_session()
             session = crud.get_video_session(db, session_id)
             
             if not session:
@@ -1,14 +1,14 @@
 import os
 import json
+import asyncio
+import hashlib
 import tempfile
+import threading
+from cachetools import TTLCache, cachedmethod
 from typing import Optional
 from google.cloud import texttospeech
 from google.oauth2 import service_account
 from sqlalchemy.orm import Session
-import sys
-
-# Add parent directories to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 import crud
 import schemas
@@ -35,6 +35,9 @@ class AudioService:
     """
     def __init__(self):
         self.client = self._create_tts_client()
+        # Voice catalogue per language code; it changes on the order of days
+        self._voices_cache = TTLCache(maxsize=64, ttl=3600)
+        self._voices_cache_lock = threading.Lock()
     
     def _create_tts_client(self):
         """
@@ -111,9 +114,12 @@ class AudioService:
         
         return response.audio_content
     
+    @cachedmethod(lambda self: self._voices_cache, lock=lambda self: self._voices_cache_lock)
     def get_available_voices(self, language_code: Optional[str] = None):
         """
         Get list of available voices from Google Cloud TTS
+        
+        Cached per language code for an hour
         """
         voices = self.client.list_voices(language_code=language_code)
         
@@ -139,6 +145,39 @@ class AudioService:
         
         return len(audio_content)
     
+    def get_cache_key(self, audio_create: schemas.AudioCreate) -> str:
+        """
+        Content-addressed key for a synthesis request; identical inputs give identical audio
+        """
+        key_source = "|".join([
+            audio_create.text_input,
+            audio_create.voice_name or "",
+            audio_create.language_code or "",
+            (audio_create.audio_format or "").upper()
+        ])
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+    
+    def _reuse_cached_audio(
+        self,
+        db: Session,
+        audio_create: schemas.AudioCreate,
+        cache_key: str
+    ) -> Optional[schemas.Audio]:
+        """
+        Record a new request against an earlier completed synthesis with the same
+        cache key, if its file is still on disk; returns None on a cache miss
+        """
+        cached_audio = crud.get_completed_audio_by_cache_key(db, cache_key)
+        if not (cached_audio and cached_audio.file_path and os.path.exists(cached_audio.file_path)):
+            return None
+        audio_record = crud.create_audio(db=db, audio=audio_create, cache_key=cache_key)
+        return crud.update_audio(db, audio_record.id, schemas.AudioUpdate(
+            status=AudioStatus.COMPLETED,
+            file_path=cached_audio.file_path,
+            file_size=cached_audio.file_size,
+            duration=cached_audio.duration
+        ))
+    
     async def process_tts_request(
         self,
         db: Session,
@@ -146,16 +185,29 @@ class AudioService:
     ) -> schemas.Audio:
         """
         Process a complete TTS request: create DB record, synthesize speech, save file
+        
+        Requests matching an earlier completed synthesis reuse its audio file
+        instead of calling Google Cloud TTS again
         """
+        # Database and filesystem calls below are blocking, so they run in
+        # worker threads to keep the event loop free for other requests
+        cache_key = self.get_cache_key(audio_create)
+        reused_audio = await asyncio.to_thread(self._reuse_cached_audio, db, audio_create, cache_key)
+        if reused_audio is not None:
+            return reused_audio
+        
         # Create initial audio record
-        audio_record = crud.create_audio(db=db, audio=audio_create)
+        audio_record = await asyncio.to_thread(crud.create_audio, db=db, audio=audio_create, cache_key=cache_key)
         
         try:
             # Update status to processing
-            crud.update_audio(db, audio_record.id, schemas.AudioUpdate(status=AudioStatus.PROCESSING))
+            await asyncio.to_thread(
+                crud.update_audio, db, audio_record.id, schemas.AudioUpdate(status=AudioStatus.PROCESSING)
+            )
             
             # Synthesize speech
-            audio_content = self.synthesize_speech(
+            audio_content = await asyncio.to_thread(
+                self.synthesize_speech,
                 text=audio_create.text_input,
                 voice_name=audio_create.voice_name,
                 language_code=audio_create.language_code,
@@ -166,7 +218,7 @@ class AudioService:
             file_path = get_audio_file_path(audio_record.id, audio_create.audio_format)
             
             # Save audio file locally first
-            file_size = self.save_audio_file(audio_content, file_path)
+            file_size = await asyncio.to_thread(self.save_audio_file, audio_content, file_path)
             
             try:
                 # Upload to GCS for backup/sharing
@@ -195,11 +247,13 @@ class AudioService:
                     file_size=file_size
                 )
             
-            return crud.update_audio(db, audio_record.id, update_data)
+            return await asyncio.to_thread(crud.update_audio, db, audio_record.id, update_data)
             
         except Exception as e:
             # Update status to failed on error
-            crud.update_audio(db, audio_record.id, schemas.AudioUpdate(status=AudioStatus.FAILED))
+            await asyncio.to_thread(
+                crud.update_audio, db, audio_record.id, schemas.AudioUpdate(status=AudioStatus.FAILED)
+            )
             raise e
 
 # Create a global audio service instance
@@ -1,12 +1,8 @@
 import os
-import sys
 import ffmpeg
 from typing import Optional
 from pathlib import Path
 
-# Add parent directories to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 from config import get_video_file_path, get_processed_video_path, ensure_temp_directories
 
 class AudioVideoService:
@@ -0,0 +1,55 @@
+import asyncio
+import logging
+import threading
+from collections import Counter
+
+import crud
+from database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+class DownloadCounter:
+    """
+    Buffers file download counts in memory and writes them with a single
+    UPDATE every few seconds instead of one UPDATE per download request
+    """
+    
+    def __init__(self, flush_interval: float = 2.0):
+        self.flush_interval = flush_interval
+        self._pending = Counter()
+        self._lock = threading.Lock()
+    
+    def record(self, file_id: int) -> None:
+        """Count one download of a file"""
+        with self._lock:
+            self._pending[file_id] += 1
+    
+    def flush(self) -> None:
+        """Write all pending counts to the database"""
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+        if not pending:
+            return
+        
+        db = SessionLocal()
+        try:
+            crud.increment_file_download_counts(db, dict(pending))
+        except Exception:
+            logger.exception("Failed to flush download counts")
+            # Keep the counts for the next flush
+            with self._lock:
+                self._pending.update(pending)
+        finally:
+            db.close()
+    
+    async def run(self) -> None:
+        """Flush periodically until cancelled, then flush whatever is left"""
+        try:
+            while True:
+                await asyncio.sleep(self.flush_interval)
+                await asyncio.to_thread(self.flush)
+        finally:
+            self.flush()
+
+# Create global download counter instance
+download_counter = DownloadCounter()
@@ -1,14 +1,9 @@
 import logging
 from typing import Optional, Dict, Any
-import sys
-import os
-
-# Add parent directories to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 import models
 import crud
-from database import get_db
+from database import db_session
 from sqlalchemy.orm import Session
 from app.services.storage_service import storage_service
 
@@ -34,27 +29,25 @@ class ImageProcessor:
             Signed download URL of the image if exists, None otherwise
         """
         try:
-            # Get database session
-            db = next(get_db())
-            
-            # Get all files for this session
-            files = crud.get_files_by_video_session(db, session_id)
+            # Reuse the current request's database session
+            db = db_session()
             
             # Find the first (and should be only) image file
+            files = crud.get_files_by_video_session(db, session_id, limit=1, content_type_prefix="image/")
+            
             for file in files:
-                if file.content_type and file.content_type.startswith("image/"):
-                    logger.info(f"Found image file for session {session_id}: {file.original_filename}")
-                    
-                    # Generate signed URL for download
-                    if file.gcs_filename:
-                        signed_url = storage_service.generate_signed_download_url(
-                            file.gcs_filename, 
-                            expiration_minutes
-                        )
-                        return signed_url
-                    else:
-                        # Fallback to public_url if gcs_filename is not available
-                        return file.public_url
+                logger.info(f"Found image file for session {session_id}: {file.original_filename}")
+                
+                # Generate signed URL for download
+                if file.gcs_filename:
+                    signed_url = storage_service.generate_signed_download_url(
+                        file.gcs_filename, 
+                        expiration_minutes
+                    )
+                    return signed_url
+                else:
+                    # Fallback to public_url if gcs_filename is not available
+                    return file.public_url
             
             logger.info(f"No image file found for session {session_id}")
             return None
@@ -75,14 +68,11 @@ class ImageProcessor:
             Dictionary with image processing results including signed download URL
         """
         try:
-            # Get database session
-            db = next(get_db())
-            
-            # Get all files for this session
-            files = crud.get_files_by_video_session(db, session_id)
+            # Reuse the current request's database session
+            db = db_session()
             
             # Find image files (should be at most one)
-            image_files = [f for f in files if f.content_type and f.content_type.startswith("image/")]
+            image_files = crud.get_files_by_video_session(db, session_id, content_type_prefix="image/")
             
             if not image_files:
                 logger.info(f"No image files found for session {session_id}")
@@ -1,11 +1,7 @@
 import os
-import sys
 from typing import Optional, Dict, Any
 from sqlalchemy.orm import Session
 
-# Add parent directories to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 from app.services.storage_service import storage_service
 import crud
 import models
@@ -46,7 +42,7 @@ class IntegrationService:
             filename = os.path.basename(local_file_path)
             
             # Upload to GCS
-            gcs_info = storage_service.upload_local_file(
+            gcs_info = await storage_service.upload_local_file(
                 local_file_path,
                 user_email,
                 filename
@@ -78,7 +74,7 @@ class IntegrationService:
         try:
             # Get audio files to backup
             if user_email:
-                audio_files = crud.get_audios_by_user_email(db, user_email)
+                audio_files = crud.get_audios_by_user_email(db, user_email, limit=1000)
             else:
                 audio_files = crud.get_audios(db, limit=1000)  # Limit for safety
             
@@ -1,13 +1,15 @@
 import os
 import json
-import sys
-from typing import Dict, Any, Optional
+import asyncio
+import copy
+import hashlib
+import logging
+from cachetools import TTLCache
+from functools import lru_cache
+from typing import AsyncIterator, Dict, Any, List, Optional
 from openai import AsyncOpenAI
 from dotenv import load_dotenv
 
-# Add parent directories to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 import models
 
 from app.prompts.constants.content_analysis_guide import (
@@ -21,6 +23,7 @@ from app.prompts.constants.audio_generation_guide import (
 )
 
 from app.prompts.pdf_analysis import (
+    chunk_pdf_for_prompt,
     get_pdf_analysis_system_prompt,
     get_pdf_analysis_user_message
 )
@@ -30,6 +33,20 @@ from app.prompts.refinement import (
     get_audio_refinement_user_message
 )
 
+# PDF text budget per analysis request (~1.5k tokens), the overlap carried
+# between consecutive chunks, and how many chunks one document may fan out to
+PDF_CHUNK_CHARS = 6000
+PDF_CHUNK_OVERLAP = 200
+MAX_PDF_CHUNKS = 4
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=8)
+def _build_pdf_system_prompt(category: models.VideoCategory) -> str:
+    """Build the full PDF analysis system prompt for a category once"""
+    return get_pdf_analysis_system_prompt(get_video_category_context(category))
+
 
 class OpenAIService:
     """
@@ -40,6 +57,9 @@ class OpenAIService:
         self.api_key = os.getenv("OPENAI_API_KEY")
         self.model = "gpt-4"  # Using GPT-4 for compatibility
         self.client = None  # Will be initialized when needed
+        # Successful analyses keyed by a hash of their inputs, so resubmitting
+        # the same text or PDF does not pay for another OpenAI call
+        self._analysis_cache = TTLCache(maxsize=512, ttl=3600)
 
     async def __aenter__(self):
         """Async context manager entry"""
@@ -75,6 +95,104 @@ class OpenAIService:
             )
         return self.client
 
+    def _analysis_cache_key(self, *parts: str) -> str:
+        """Hash analysis inputs into a cache key"""
+        return hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()
+
+    def _get_cached_analysis(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """A private copy of a cached analysis; no tokens were spent on it, so usage is zeroed"""
+        cached = self._analysis_cache.get(cache_key)
+        if cached is None:
+            return None
+        result = copy.deepcopy(cached)
+        if result.get("usage"):
+            result["usage"] = dict.fromkeys(result["usage"], 0)
+        return result
+
+    def _cache_analysis(self, cache_key: str, result: Dict[str, Any]) -> None:
+        """Cache a copy so later changes to the returned result can't leak into the cache"""
+        self._analysis_cache[cache_key] = copy.deepcopy(result)
+
+    def _get_usage(self, response, endpoint: str) -> Dict[str, int]:
+        """Token usage of a completion, including how much of the prompt was served from OpenAI's prompt cache"""
+        usage = response.usage
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None) or 0
+        if usage.prompt_tokens:
+            logger.debug(
+                "OpenAI %s: %s/%s prompt tokens cached (%.0f%%)",
+                endpoint, cached_tokens, usage.prompt_tokens, 100 * cached_tokens / usage.prompt_tokens
+            )
+        return {
+            "prompt_tokens": usage.prompt_tokens,
+            "completion_tokens": usage.completion_tokens,
+            "total_tokens": usage.total_tokens,
+            "cached_tokens": cached_tokens
+        }
+
+    def _build_analysis_user_message(self, user_input: str, user_context: Optional[str]) -> str:
+        """Format the user message for content analysis"""
+        user_message = f"""User input: {user_input}"""
+        if user_context:
+            user_message += f"\n\nAdditional context: {user_context}"
+        return user_message
+
+    async def _stream_completion(
+            self,
+            system_prompt: str,
+            user_message: str,
+            temperature: float,
+            max_tokens: int
+    ) -> AsyncIterator[str]:
+        """Yield the text deltas of a chat completion as the model produces them"""
+        client = self._get_client()
+        stream = await client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_message}
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    def analyze_and_generate_prompts_stream(
+            self,
+            user_input: str,
+            user_context: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream the raw JSON analysis for user input as it is generated
+
+        Same prompt as analyze_and_generate_prompts; the caller receives the
+        model output in pieces and parses the JSON once the stream ends
+        """
+        return self._stream_completion(
+            CONTENT_ANALYSIS_SYSTEM_PROMPT,
+            self._build_analysis_user_message(user_input, user_context),
+            temperature=0.7,
+            max_tokens=1500
+        )
+
+    def refine_prompt_stream(
+            self,
+            prompt_type: str,
+            original_prompt: str,
+            user_feedback: str
+    ) -> AsyncIterator[str]:
+        """Stream a refined video or audio prompt as it is generated"""
+        if prompt_type == "video":
+            system_prompt = VIDEO_PROMPT_REFINEMENT_SYSTEM_PROMPT
+            user_message = get_video_refinement_user_message(original_prompt, user_feedback)
+        else:
+            system_prompt = AUDIO_PROMPT_REFINEMENT_SYSTEM_PROMPT
+            user_message = get_audio_refinement_user_message(original_prompt, user_feedback)
+        return self._stream_completion(system_prompt, user_message, temperature=0.6, max_tokens=800)
+
     async def analyze_and_generate_prompts(
             self,
             user_input: str,
@@ -90,15 +208,18 @@ class OpenAIService:
         Returns:
             Dictionary containing analysis results and generated prompts
         """
+        cache_key = self._analysis_cache_key("analyze", user_input, user_context or "")
+        cached = self._get_cached_analysis(cache_key)
+        if cached is not None:
+            return cached
+
         try:
 
             # Use the imported system prompt for dual prompt generation
             system_prompt = CONTENT_ANALYSIS_SYSTEM_PROMPT
 
             # Construct user message
-            user_message = f"""User input: {user_input}"""
-            if user_context:
-                user_message += f"\n\nAdditional context: {user_context}"
+            user_message = self._build_analysis_user_message(user_input, user_context)
 
             # Call OpenAI API
             client = self._get_client()
@@ -118,16 +239,14 @@ class OpenAIService:
             # Try to parse as JSON
             try:
                 result = json.loads(content)
-                return {
+                analysis_result = {
                     "success": True,
                     "data": result,
                     "raw_response": content,
-                    "usage": {
-                        "prompt_tokens": response.usage.prompt_tokens,
-                        "completion_tokens": response.usage.completion_tokens,
-                        "total_tokens": response.usage.total_tokens
-                    }
+                    "usage": self._get_usage(response, "analyze")
                 }
+                self._cache_analysis(cache_key, analysis_result)
+                return analysis_result
             except json.JSONDecodeError:
                 # If JSON parsing fails, return raw content
                 return {
@@ -185,7 +304,8 @@ class OpenAIService:
                 "success": True,
                 "refined_prompt": refined_prompt,
                 "original_prompt": original_prompt,
-                "user_feedback": user_feedback
+                "user_feedback": user_feedback,
+                "usage": self._get_usage(response, "refine")
             }
 
         except Exception as e:
@@ -231,7 +351,8 @@ class OpenAIService:
                 "success": True,
                 "refined_prompt": refined_prompt,
                 "original_prompt": original_prompt,
-                "user_feedback": user_feedback
+                "user_feedback": user_feedback,
+                "usage": self._get_usage(response, "refine")
             }
 
         except Exception as e:
@@ -243,7 +364,7 @@ class OpenAIService:
 
     def _get_video_category_context(self, category: Optional[models.VideoCategory]) -> str:
         """Get context-specific information based on video category"""
-        return get_video_category_context(category)
+        return get_video_category_context(category or models.VideoCategory.GENERAL_VIDEO)
 
     async def analyze_pdf_content_and_generate_prompts(
             self,
@@ -254,6 +375,10 @@ class OpenAIService:
         """
         Analyze PDF content and user prompt to generate video and audio prompts
 
+        Long documents are split into chunks that are analyzed concurrently
+        and merged (see _merge_pdf_chunk_results); at most MAX_PDF_CHUNKS are
+        analyzed, and the result's `truncated` flag reports when text was left out
+
         Args:
             user_prompt: User's specific instructions for the video
             pdf_content: Combined text content from PDF files
@@ -262,71 +387,44 @@ class OpenAIService:
         Returns:
             Dictionary containing analysis results and generated prompts
         """
-        try:
-            # Get category-specific context
-            category_context = self._get_video_category_context(category)
-
-            # Use the imported system prompt for PDF-based prompt generation
-            system_prompt = get_pdf_analysis_system_prompt(category_context)
-
-            # Limit PDF content to avoid token limits
-            limited_pdf_content = pdf_content[:6000] if len(pdf_content) > 6000 else pdf_content
-
-            # Use the imported user message formatter
-            user_message = get_pdf_analysis_user_message(user_prompt, limited_pdf_content)
-
-            # Call OpenAI API
-            client = self._get_client()
-            response = await client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message}
-                ],
-                temperature=0.7,
-                max_tokens=2000
-            )
+        cache_key = self._analysis_cache_key(
+            "pdf", user_prompt, category.value if category else "general", pdf_content
+        )
+        cached = self._get_cached_analysis(cache_key)
+        if cached is not None:
+            return cached
 
-            # Parse the response
-            content = response.choices[0].message.content
+        try:
+            # Category-specific PDF analysis system prompt, built once per category
+            system_prompt = _build_pdf_system_prompt(category or models.VideoCategory.GENERAL_VIDEO)
+
+            # Split the PDF text into chunks that fit the per-request budget;
+            # anything past MAX_PDF_CHUNKS is not analyzed and is flagged below
+            all_chunks = chunk_pdf_for_prompt(pdf_content, PDF_CHUNK_CHARS, PDF_CHUNK_OVERLAP)
+            chunks = all_chunks[:MAX_PDF_CHUNKS]
+            truncated = len(all_chunks) > len(chunks)
+            if truncated:
+                logger.warning(
+                    "PDF content split into %d chunks; analyzing the first %d (%d of %d chars)",
+                    len(all_chunks), len(chunks), sum(len(chunk) for chunk in chunks), len(pdf_content)
+                )
 
-            # Try to parse as JSON
-            try:
-                result = json.loads(content)
-                return {
-                    "success": True,
-                    "data": result,
-                    "raw_response": content,
-                    "category": category.value if category else "general",
-                    "pdf_processed": True,
-                    "usage": {
-                        "prompt_tokens": response.usage.prompt_tokens,
-                        "completion_tokens": response.usage.completion_tokens,
-                        "total_tokens": response.usage.total_tokens
-                    }
-                }
-            except json.JSONDecodeError:
-                # If JSON parsing fails, return structured fallback
-                return {
-                    "success": True,
-                    "data": {
-                        "analysis": {
-                            "main_theme": "Document-based content",
-                            "key_elements": ["PDF content analysis"],
-                            "important_details": ["Content extracted from uploaded documents"],
-                            "style_preference": "Professional",
-                            "mood": "Informative",
-                            "pdf_summary": "PDF content processed"
-                        },
-                        "video_prompt": content,
-                        "audio_prompt": content,
-                        "enhanced_user_prompt": user_prompt
-                    },
-                    "raw_response": content,
-                    "category": category.value if category else "general",
-                    "pdf_processed": True,
-                    "warning": "Response was not in expected JSON format"
-                }
+            if len(chunks) == 1:
+                result = await self._analyze_pdf_chunk(system_prompt, user_prompt, chunks[0], category)
+            else:
+                results = await asyncio.gather(*(
+                    self._analyze_pdf_chunk(system_prompt, user_prompt, chunk, category)
+                    for chunk in chunks
+                ))
+                result = self._merge_pdf_chunk_results(results)
+            result["chunks_analyzed"] = len(chunks)
+            result["chunks_total"] = len(all_chunks)
+            result["truncated"] = truncated
+
+            # Only cache analyses that parsed cleanly
+            if "warning" not in result:
+                self._cache_analysis(cache_key, result)
+            return result
 
         except Exception as e:
             return {
@@ -336,6 +434,98 @@ class OpenAIService:
                 "pdf_processed": False
             }
 
+    async def _analyze_pdf_chunk(
+            self,
+            system_prompt: str,
+            user_prompt: str,
+            pdf_chunk: str,
+            category: Optional[models.VideoCategory]
+    ) -> Dict[str, Any]:
+        """Run the PDF analysis prompt over a single chunk of PDF text"""
+        # Use the imported user message formatter
+        user_message = get_pdf_analysis_user_message(user_prompt, pdf_chunk)
+
+        # Call OpenAI API
+        client = self._get_client()
+        response = await client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_message}
+            ],
+            temperature=0.7,
+            max_tokens=2000
+        )
+
+        # Parse the response
+        content = response.choices[0].message.content
+
+        # Try to parse as JSON
+        try:
+            result = json.loads(content)
+            return {
+                "success": True,
+                "data": result,
+                "raw_response": content,
+                "category": category.value if category else "general",
+                "pdf_processed": True,
+                "usage": self._get_usage(response, "pdf-analyze")
+            }
+        except json.JSONDecodeError:
+            # If JSON parsing fails, return structured fallback
+            return {
+                "success": True,
+                "data": {
+                    "analysis": {
+                        "main_theme": "Document-based content",
+                        "key_elements": ["PDF content analysis"],
+                        "important_details": ["Content extracted from uploaded documents"],
+                        "style_preference": "Professional",
+                        "mood": "Informative",
+                        "pdf_summary": "PDF content processed"
+                    },
+                    "video_prompt": content,
+                    "audio_prompt": content,
+                    "enhanced_user_prompt": user_prompt
+                },
+                "raw_response": content,
+                "category": category.value if category else "general",
+                "pdf_processed": True,
+                "warning": "Response was not in expected JSON format"
+            }
+
+    def _merge_pdf_chunk_results(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Merge per-chunk PDF analyses into one result
+
+        The prompts and main theme come from the first chunk (the start of the
+        document); key_elements and important_details are unioned in order and
+        the chunk summaries are concatenated
+        """
+        parsed = [result for result in results if "warning" not in result]
+        if not parsed:
+            return results[0]
+
+        merged = dict(parsed[0])
+        data = dict(merged["data"])
+        analysis = dict(data.get("analysis") or {})
+        chunk_analyses = [result["data"].get("analysis") or {} for result in parsed]
+
+        for key in ("key_elements", "important_details"):
+            items = [item for chunk_analysis in chunk_analyses for item in chunk_analysis.get(key) or []]
+            analysis[key] = list(dict.fromkeys(str(item) for item in items))
+        analysis["pdf_summary"] = " ".join(
+            chunk_analysis["pdf_summary"] for chunk_analysis in chunk_analyses if chunk_analysis.get("pdf_summary")
+        )
+
+        data["analysis"] = analysis
+        merged["data"] = data
+        merged["usage"] = {
+            key: sum(result["usage"][key] for result in parsed)
+            for key in parsed[0]["usage"]
+        }
+        return merged
+
 # Create a global OpenAI service instance with lazy loading
 def get_openai_service():
     """Get OpenAI service instance"""
@@ -2,15 +2,10 @@ import io
 import logging
 from typing import List, Optional, Dict, Any
 from pypdf import PdfReader
-import sys
-import os
-
-# Add parent directories to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 import models
 import crud
-from database import get_db
+from database import db_session
 from sqlalchemy.orm import Session
 
 # Set up logging
@@ -69,11 +64,11 @@ class PDFProcessor:
             List of dictionaries with file info and extracted text
         """
         try:
-            # Get database session
-            db = next(get_db())
+            # Reuse the current request's database session
+            db = db_session()
             
-            # Get all files for this session
-            files = crud.get_files_by_video_session(db, session_id)
+            # Only the session's PDFs are needed
+            files = crud.get_files_by_video_session(db, session_id, content_type_prefix="application/pdf")
             
             pdf_contents = []
             
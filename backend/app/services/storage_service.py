@@ -1,17 +1,18 @@
+import io
 import os
-import sys
 import uuid
+import asyncio
+import threading
+import time
 import mimetypes
 from datetime import datetime, timedelta
-from typing import Optional, List, BinaryIO
+from typing import Optional, List, BinaryIO, Union
 from pathlib import Path
+from cachetools import TTLCache
 from google.cloud import storage
 from google.oauth2 import service_account
 import json
 
-# Add parent directories to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 from config import (
     GCP_BUCKET_NAME, 
     GCP_PROJECT_ID, 
@@ -22,6 +23,13 @@ from config import (
     ALLOWED_IMAGE_EXTENSIONS
 )
 
+# Resumable uploads send 8MB per request (must be a multiple of 256KB)
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Signed download URLs expire on 5-minute boundaries so repeat requests in the
+# same window map to the same URL and can skip the RSA signing step
+SIGNED_URL_BUCKET_SECONDS = 5 * 60
+
 class StorageService:
     """
     Google Cloud Storage service for file upload and download operations
@@ -31,6 +39,8 @@ class StorageService:
         self.client = self._create_storage_client()
         self.bucket_name = GCP_BUCKET_NAME
         self.bucket = self.client.bucket(self.bucket_name)
+        self._signed_url_cache = TTLCache(maxsize=4096, ttl=SIGNED_URL_BUCKET_SECONDS)
+        self._signed_url_cache_lock = threading.Lock()
     
     def _create_storage_client(self):
         """
@@ -153,7 +163,7 @@ class StorageService:
 
     async def upload_file(
         self,
-        file_content: bytes,
+        file_content: Union[bytes, BinaryIO],
         filename: str,
         user_id: Optional[int] = None,
         content_type: Optional[str] = None
@@ -161,11 +171,18 @@ class StorageService:
         """
         Upload file to Google Cloud Storage
         
+        Accepts bytes or a seekable binary file (e.g. UploadFile.file); files are
+        streamed to GCS in UPLOAD_CHUNK_SIZE pieces rather than read into memory
+        
         Returns:
             dict: File information including GCS path and public URL
         """
+        file_obj = io.BytesIO(file_content) if isinstance(file_content, (bytes, bytearray)) else file_content
+        file_size = file_obj.seek(0, os.SEEK_END)
+        file_obj.seek(0)
+        
         # Validate file
-        self.validate_file(filename, len(file_content))
+        self.validate_file(filename, file_size)
         
         # Generate unique filename
         gcs_filename = self.generate_unique_filename(filename, user_id)
@@ -178,10 +195,13 @@ class StorageService:
         
         try:
             # Create blob and upload
-            blob = self.bucket.blob(gcs_filename)
-            blob.upload_from_string(
-                file_content,
-                content_type=content_type
+            blob = self.bucket.blob(gcs_filename, chunk_size=UPLOAD_CHUNK_SIZE)
+            await asyncio.to_thread(
+                blob.upload_from_file,
+                file_obj,
+                size=file_size,
+                content_type=content_type,
+                checksum="crc32c"
             )
             
             # Make blob publicly readable (optional)
@@ -191,7 +211,9 @@ class StorageService:
                 "original_filename": filename,
                 "gcs_filename": gcs_filename,
                 "bucket_name": self.bucket_name,
-                "size": len(file_content),
+                "size": file_size,
+                # Computed by GCS during the upload, so no local hashing pass is needed
+                "md5_hash": blob.md5_hash,
                 "content_type": content_type,
                 "category": self.get_file_category(filename),
                 "public_url": f"https://storage.googleapis.com/{self.bucket_name}/{gcs_filename}",
@@ -203,14 +225,14 @@ class StorageService:
         except Exception as e:
             raise RuntimeError(f"Failed to upload file to GCS: {str(e)}")
     
-    def upload_local_file(
+    async def upload_local_file(
         self,
         local_file_path: str,
         user_id: Optional[int] = None,
         custom_filename: Optional[str] = None
     ) -> dict:
         """
-        Upload local file to GCS
+        Upload local file to GCS, streaming it from disk
         """
         if not os.path.exists(local_file_path):
             raise FileNotFoundError(f"Local file not found: {local_file_path}")
@@ -218,9 +240,7 @@ class StorageService:
         filename = custom_filename or os.path.basename(local_file_path)
         
         with open(local_file_path, 'rb') as f:
-            file_content = f.read()
-        
-        return self.upload_file(file_content, filename, user_id)
+            return await self.upload_file(f, filename, user_id)
     
     def generate_signed_download_url(
         self,
@@ -229,18 +249,29 @@ class StorageService:
     ) -> str:
         """
         Generate signed URL for secure file download
+        
+        The URL stays valid for at least expiration_minutes; the expiry is rounded
+        up to the next 5-minute boundary and the signed URL reused until then
         """
         try:
-            blob = self.bucket.blob(gcs_filename)
+            # Generate signed URL valid for (at least) the specified minutes
+            expires_ts = time.time() + expiration_minutes * 60
+            expires_ts = int(-(-expires_ts // SIGNED_URL_BUCKET_SECONDS) * SIGNED_URL_BUCKET_SECONDS)
+            cache_key = (gcs_filename, expires_ts)
             
-            # Generate signed URL valid for specified minutes
-            expiration = datetime.utcnow() + timedelta(minutes=expiration_minutes)
+            with self._signed_url_cache_lock:
+                signed_url = self._signed_url_cache.get(cache_key)
+            if signed_url:
+                return signed_url
             
+            blob = self.bucket.blob(gcs_filename)
             signed_url = blob.generate_signed_url(
-                expiration=expiration,
+                expiration=datetime.utcfromtimestamp(expires_ts),
                 method="GET"
             )
             
+            with self._signed_url_cache_lock:
+                self._signed_url_cache[cache_key] = signed_url
             return signed_url
             
         except Exception as e:
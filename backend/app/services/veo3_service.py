@@ -1,5 +1,4 @@
 import os
-import sys
 import asyncio
 import aiohttp
 import aiofiles
@@ -7,9 +6,6 @@ from typing import Dict, Any, Optional
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Add parent directories to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 from config import VEO3_MODEL, VEO3_MODEL_FRAMES, get_video_file_path, ensure_temp_directories
 
 # Load environment variables
@@ -32,8 +28,32 @@ class VEO3Service:
         self.max_wait_seconds = 15 * 60  # 15 minutes
         self.timeout_seconds = 30
         
+        # Shared HTTP session, created on first use so connections are kept alive between calls
+        self.session: Optional[aiohttp.ClientSession] = None
+        
         ensure_temp_directories()
     
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Lazy initialization of the shared aiohttp session"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession()
+        return self.session
+    
+    async def close(self):
+        """Close the shared aiohttp session"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+    
+    async def prewarm(self) -> None:
+        """Open a keep-alive connection to the VEO3 API ahead of the first real request"""
+        try:
+            session = self._get_session()
+            async with session.head(self.base_url, timeout=aiohttp.ClientTimeout(total=self.timeout_seconds)):
+                pass
+        except Exception as e:
+            print(f"VEO3 prewarm failed: {str(e)}")
+    
     def _extract_task_id(self, response_data: Dict[str, Any]) -> Optional[str]:
         """Extract task ID from create response"""
         if not response_data:
@@ -157,29 +177,29 @@ class VEO3Service:
                 payload["images"] = images
                 payload["model"] = VEO3_MODEL_FRAMES   
                 
-            async with aiohttp.ClientSession() as session:
-                
-                response_data = await self._make_request(
-                    session, 'POST', self.create_url, json=payload
-                )
-                
-                task_id = self._extract_task_id(response_data)
-                
-                if not task_id:
-                    return {
-                        "success": False,
-                        "error": f"Failed to extract task ID from response: {response_data}",
-                        "response_data": response_data
-                    }
-                
+            session = self._get_session()
+            
+            response_data = await self._make_request(
+                session, 'POST', self.create_url, json=payload
+            )
+            
+            task_id = self._extract_task_id(response_data)
+            
+            if not task_id:
                 return {
-                    "success": True,
-                    "task_id": task_id,
-                    "prompt": prompt,
-                    "model": model,
+                    "success": False,
+                    "error": f"Failed to extract task ID from response: {response_data}",
                     "response_data": response_data
                 }
-                
+            
+            return {
+                "success": True,
+                "task_id": task_id,
+                "prompt": prompt,
+                "model": model,
+                "response_data": response_data
+            }
+            
         except Exception as e:
             return {
                 "success": False,
@@ -204,83 +224,83 @@ class VEO3Service:
         start_time = asyncio.get_event_loop().time()
         
         try:
-            async with aiohttp.ClientSession() as session:
-                while True:
-                    # Check timeout
-                    elapsed = asyncio.get_event_loop().time() - start_time
-                    if elapsed > self.max_wait_seconds:
-                        return {
-                            "success": False,
-                            "error": f"Task polling timeout after {self.max_wait_seconds} seconds",
-                            "task_id": task_id,
-                            "elapsed_seconds": elapsed
-                        }
+            session = self._get_session()
+            while True:
+                # Check timeout
+                elapsed = asyncio.get_event_loop().time() - start_time
+                if elapsed > self.max_wait_seconds:
+                    return {
+                        "success": False,
+                        "error": f"Task polling timeout after {self.max_wait_seconds} seconds",
+                        "task_id": task_id,
+                        "elapsed_seconds": elapsed
+                    }
+                
+                try:
+                    # Query task status
+                    query_url = f"{self.query_url}?id={task_id}"
+                    response_data = await self._make_request(session, 'GET', query_url)
                     
-                    try:
-                        # Query task status
-                        query_url = f"{self.query_url}?id={task_id}"
-                        response_data = await self._make_request(session, 'GET', query_url)
-                        
-                        status_info = self._extract_status_info(response_data)
-                        status = status_info.get("status", "").lower()
+                    status_info = self._extract_status_info(response_data)
+                    status = status_info.get("status", "").lower()
+                    
+                    # Check for completion
+                    if status in ['succeeded', 'finished', 'complete', 'completed', 'done', 'ok', 'success']:
+                        video_url = status_info.get("video_url")
                         
-                        # Check for completion
-                        if status in ['succeeded', 'finished', 'complete', 'completed', 'done', 'ok', 'success']:
-                            video_url = status_info.get("video_url")
-                            
-                            if not video_url:
-                                # Try alternative extraction methods
-                                video_url = (
-                                    response_data.get("video_url") or
-                                    response_data.get("detail", {}).get("video_url") or
-                                    response_data.get("detail", {}).get("url") or
-                                    response_data.get("data", {}).get("video_url") or
-                                    response_data.get("data", {}).get("url") or
-                                    response_data.get("url")
-                                )
-                            
-                            if video_url:
-                                return {
-                                    "success": True,
-                                    "status": "completed",
-                                    "video_url": video_url,
-                                    "task_id": task_id,
-                                    "elapsed_seconds": elapsed,
-                                    "response_data": response_data
-                                }
-                            else:
-                                return {
-                                    "success": False,
-                                    "error": "Task completed but no video URL found",
-                                    "task_id": task_id,
-                                    "response_data": response_data
-                                }
+                        if not video_url:
+                            # Try alternative extraction methods
+                            video_url = (
+                                response_data.get("video_url") or
+                                response_data.get("detail", {}).get("video_url") or
+                                response_data.get("detail", {}).get("url") or
+                                response_data.get("data", {}).get("video_url") or
+                                response_data.get("data", {}).get("url") or
+                                response_data.get("url")
+                            )
                         
-                        # Check for failure
-                        if status in ['failed', 'error', 'cancelled', 'canceled']:
-                            error_msg = status_info.get("error_msg", "Unknown error")
+                        if video_url:
+                            return {
+                                "success": True,
+                                "status": "completed",
+                                "video_url": video_url,
+                                "task_id": task_id,
+                                "elapsed_seconds": elapsed,
+                                "response_data": response_data
+                            }
+                        else:
                             return {
                                 "success": False,
-                                "error": f"Task failed: {error_msg}",
-                                "status": status,
+                                "error": "Task completed but no video URL found",
                                 "task_id": task_id,
                                 "response_data": response_data
                             }
-                        
-                        # Log progress if available
-                        progress = status_info.get("progress")
-                        if progress is not None:
-                            print(f"Task {task_id} progress: {progress}%")
-                        
-                        if status:
-                            print(f"Task {task_id} status: {status}")
                     
-                    except Exception as poll_error:
-                        print(f"Polling error (will retry): {poll_error}")
+                    # Check for failure
+                    if status in ['failed', 'error', 'cancelled', 'canceled']:
+                        error_msg = status_info.get("error_msg", "Unknown error")
+                        return {
+                            "success": False,
+                            "error": f"Task failed: {error_msg}",
+                            "status": status,
+                            "task_id": task_id,
+                            "response_data": response_data
+                        }
                     
-                    # Wait before next poll
-                    await asyncio.sleep(self.poll_interval_seconds)
+                    # Log progress if available
+                    progress = status_info.get("progress")
+                    if progress is not None:
+                        print(f"Task {task_id} progress: {progress}%")
                     
+                    if status:
+                        print(f"Task {task_id} status: {status}")
+                
+                except Exception as poll_error:
+                    print(f"Polling error (will retry): {poll_error}")
+                
+                # Wait before next poll
+                await asyncio.sleep(self.poll_interval_seconds)
+                
         except Exception as e:
             return {
                 "success": False,
@@ -303,20 +323,20 @@ class VEO3Service:
         try:
             output_path = get_video_file_path(output_video_id, format)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    video_url, 
-                    timeout=aiohttp.ClientTimeout(total=300)  # 5 minutes for download
-                ) as response:
-                    response.raise_for_status()
-                    
-                    # Create directory if it doesn't exist
-                    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-                    
-                    # Download file
-                    async with aiofiles.open(output_path, 'wb') as file:
-                        async for chunk in response.content.iter_chunked(8192):
-                            await file.write(chunk)
+            session = self._get_session()
+            async with session.get(
+                video_url, 
+                timeout=aiohttp.ClientTimeout(total=300)  # 5 minutes for download
+            ) as response:
+                response.raise_for_status()
+                
+                # Create directory if it doesn't exist
+                os.makedirs(os.path.dirname(output_path), exist_ok=True)
+                
+                # Download file
+                async with aiofiles.open(output_path, 'wb') as file:
+                    async for chunk in response.content.iter_chunked(8192):
+                        await file.write(chunk)
             
             # Get file size
             file_size = os.path.getsize(output_path)
@@ -1,12 +1,10 @@
 import os
-import sys
 import ffmpeg
+import threading
+from cachetools import TTLCache
 from typing import List, Optional
 from pathlib import Path
 
-# Add parent directories to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 from config import get_video_file_path, get_processed_video_path, ensure_temp_directories
 
 class VideoService:
@@ -17,6 +15,9 @@ class VideoService:
     
     def __init__(self):
         ensure_temp_directories()
+        # ffprobe results keyed on (path, mtime) so rewritten files are re-probed
+        self._info_cache = TTLCache(maxsize=1024, ttl=300)
+        self._info_cache_lock = threading.Lock()
     
     def merge_videos(
         self, 
@@ -138,6 +139,23 @@ class VideoService:
         Returns:
             Dictionary containing video information
         """
+        try:
+            cache_key = (video_path, os.stat(video_path).st_mtime)
+        except OSError:
+            # Let ffprobe report the missing/unreadable file as before
+            return self._probe_video_info(video_path)
+        
+        with self._info_cache_lock:
+            info = self._info_cache.get(cache_key)
+        if info is None:
+            info = self._probe_video_info(video_path)
+            with self._info_cache_lock:
+                self._info_cache[cache_key] = info
+        
+        return dict(info)
+    
+    def _probe_video_info(self, video_path: str) -> dict:
+        """Run ffprobe and extract stream information"""
         try:
             probe = ffmpeg.probe(video_path)
             video_stream = next((stream for stream in probe['streams'] if stream['codec_type'] == 'video'), None)
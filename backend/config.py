@@ -24,6 +24,10 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o")
 OPENAI_MAX_TOKENS = int(os.getenv("OPENAI_MAX_TOKENS", "1500"))
 OPENAI_TEMPERATURE = float(os.getenv("OPENAI_TEMPERATURE", "0.7"))
+# Upper bound for a single OpenAI call made from the API routes; a timed out
+# call is retried OPENAI_REQUEST_RETRIES times with exponential backoff
+OPENAI_REQUEST_TIMEOUT = float(os.getenv("OPENAI_REQUEST_TIMEOUT", "30"))
+OPENAI_REQUEST_RETRIES = int(os.getenv("OPENAI_REQUEST_RETRIES", "1"))
 
 # VEO3 Configuration
 VEO3_API_KEY = os.getenv("VEO3_API_KEY")
@@ -32,9 +36,47 @@ VEO3_MODEL = os.getenv("VEO3_MODEL", "veo3-fast-frames")
 VEO3_MODEL_FRAMES = os.getenv("VEO3_MODEL_FRAMES", "veo3-fast-frames")
 VEO3_POLL_INTERVAL = int(os.getenv("VEO3_POLL_INTERVAL", "5"))
 VEO3_MAX_WAIT_TIME = int(os.getenv("VEO3_MAX_WAIT_TIME", "900"))  # 15 minutes
+# Upper bound for a whole create -> poll -> download run; never retried since
+# each attempt creates a new (billed) generation task
+VEO3_REQUEST_TIMEOUT = float(os.getenv("VEO3_REQUEST_TIMEOUT", "1200"))  # 20 minutes
+
+# CORS settings
+ALLOWED_ORIGINS = frozenset({
+    "http://localhost:5173",
+    "http://localhost:3000",
+    "http://localhost:8080",
+})
+
+# Database settings
+# Create missing tables when each worker starts up (local dev). Deployments
+# run `python init_db.py` once and set this to false so workers skip it.
+CREATE_TABLES = os.getenv("CREATE_TABLES", "true").lower() == "true"
+# Connection pool sizing; handlers run queries in the threadpool, so the pool
+# needs room for that many concurrent sessions before callers start waiting
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+
+# Response settings
+# When disabled, list endpoints build response models from trusted ORM rows
+# with model_construct instead of re-validating every row
+ENABLE_RESPONSE_VALIDATION = os.getenv("ENABLE_RESPONSE_VALIDATION", "false").lower() == "true"
 
 # File upload settings
 MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
+# Largest request body the upload routes will read (a multi-file batch counts as one request)
+MAX_UPLOAD_REQUEST_SIZE = int(os.getenv("MAX_UPLOAD_REQUEST_SIZE", str(10 * MAX_FILE_SIZE)))
+# GCS uploads allowed in flight at once per worker (shared by all requests),
+# and how long an upload waits for a free slot before the request gets a 503
+UPLOAD_CONCURRENCY_LIMIT = int(os.getenv("UPLOAD_CONCURRENCY_LIMIT", "10"))
+UPLOAD_SLOT_TIMEOUT = float(os.getenv("UPLOAD_SLOT_TIMEOUT", "30"))
+
+# Video processing settings
+# FFmpeg jobs are CPU-bound. The cap applies per worker process, so the default
+# splits the cores across the WEB_CONCURRENCY workers (about one job per core overall)
+_WEB_WORKERS = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+FFMPEG_MAX_JOBS = int(os.getenv("FFMPEG_MAX_JOBS", str(max(1, (os.cpu_count() or 1) // _WEB_WORKERS))))
+
 ALLOWED_AUDIO_EXTENSIONS = {".mp3", ".wav", ".aac", ".ogg", ".m4a"}
 ALLOWED_VIDEO_EXTENSIONS = {".mp4", ".avi", ".mov", ".wmv", ".flv", ".webm"}
 ALLOWED_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp"}
@@ -1,15 +1,29 @@
+from sqlalchemy import case, func, insert
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+from threading import Lock
+import uuid
+from cachetools import TTLCache
 import models, schemas
 
+# (file_path, audio_format) of completed audio, filled when a row is read so the
+# usual GET /audio/{id} -> /audio/{id}/download sequence skips the second query
+_audio_download_cache = TTLCache(maxsize=1024, ttl=30)
+_audio_download_cache_lock = Lock()
+
 def get_user(db: Session, user_id: int) -> Optional[models.User]:
     return db.query(models.User).filter(models.User.id == user_id).first()
 
 def get_user_by_email(db: Session, email: str) -> Optional[models.User]:
     return db.query(models.User).filter(models.User.email == email).first()
 
-def get_users(db: Session, skip: int = 0, limit: int = 100) -> List[models.User]:
-    return db.query(models.User).offset(skip).limit(limit).all()
+def get_users(db: Session, skip: int = 0, limit: int = 100, after_id: Optional[int] = None) -> List[models.User]:
+    query = db.query(models.User).order_by(models.User.id)
+    if after_id is not None:
+        # Keyset pagination: seek past the cursor on the primary key instead of scanning `skip` rows
+        return query.filter(models.User.id > after_id).limit(limit).all()
+    # Same id order as the keyset pages, so the X-Next-Cursor from an offset page is valid
+    return query.offset(skip).limit(limit).all()
 
 def create_user(db: Session, user: schemas.UserCreate) -> models.User:
     db_user = models.User(email=user.email)
@@ -27,8 +41,12 @@ def get_videos_by_user_email(db: Session, user_email: str) -> List[models.Video]
 def get_video_by_task_id(db: Session, video_task_id: str) -> Optional[models.Video]:
     return db.query(models.Video).filter(models.Video.video_task_id == video_task_id).first()
 
-def get_videos(db: Session, skip: int = 0, limit: int = 100) -> List[models.Video]:
-    return db.query(models.Video).offset(skip).limit(limit).all()
+def get_videos(db: Session, skip: int = 0, limit: int = 100, after_id: Optional[int] = None) -> List[models.Video]:
+    query = db.query(models.Video).order_by(models.Video.id)
+    if after_id is not None:
+        # Keyset pagination: seek past the cursor on the primary key instead of scanning `skip` rows
+        return query.filter(models.Video.id > after_id).limit(limit).all()
+    return query.offset(skip).limit(limit).all()
 
 def create_video(db: Session, video: schemas.VideoCreate) -> models.Video:
     db_video = models.Video(
@@ -45,7 +63,7 @@ def create_video(db: Session, video: schemas.VideoCreate) -> models.Video:
 def update_video(db: Session, video_id: int, video_update: schemas.VideoUpdate) -> Optional[models.Video]:
     db_video = db.query(models.Video).filter(models.Video.id == video_id).first()
     if db_video:
-        update_data = video_update.dict(exclude_unset=True)
+        update_data = video_update.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_video, field, value)
         db.commit()
@@ -55,19 +73,49 @@ def update_video(db: Session, video_id: int, video_update: schemas.VideoUpdate)
 def get_audio(db: Session, audio_id: int) -> Optional[models.Audio]:
     return db.query(models.Audio).filter(models.Audio.id == audio_id).first()
 
-def get_audios_by_user_email(db: Session, user_email: str) -> List[models.Audio]:
-    return db.query(models.Audio).filter(models.Audio.user_email == user_email).all()
-
-def get_audios(db: Session, skip: int = 0, limit: int = 100) -> List[models.Audio]:
-    return db.query(models.Audio).offset(skip).limit(limit).all()
-
-def create_audio(db: Session, audio: schemas.AudioCreate) -> models.Audio:
+def get_audios_by_user_email(
+    db: Session, user_email: str, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+) -> List[models.Audio]:
+    query = db.query(models.Audio).filter(models.Audio.user_email == user_email).order_by(models.Audio.id)
+    if after_id is not None:
+        return query.filter(models.Audio.id > after_id).limit(limit).all()
+    return query.offset(skip).limit(limit).all()
+
+def cache_audio_download(db_audio: models.Audio) -> Optional[Tuple[str, str]]:
+    """Remember download info for a completed audio row and return it"""
+    if db_audio.status != models.AudioStatus.COMPLETED:
+        return None
+    info = (db_audio.file_path, db_audio.audio_format)
+    with _audio_download_cache_lock:
+        _audio_download_cache[db_audio.id] = info
+    return info
+
+def get_cached_audio_download(audio_id: int) -> Optional[Tuple[str, str]]:
+    """Download info cached by cache_audio_download, if still fresh"""
+    with _audio_download_cache_lock:
+        return _audio_download_cache.get(audio_id)
+
+def get_audios(db: Session, skip: int = 0, limit: int = 100, after_id: Optional[int] = None) -> List[models.Audio]:
+    query = db.query(models.Audio).order_by(models.Audio.id)
+    if after_id is not None:
+        # Keyset pagination: seek past the cursor on the primary key instead of scanning `skip` rows
+        return query.filter(models.Audio.id > after_id).limit(limit).all()
+    return query.offset(skip).limit(limit).all()
+
+def get_completed_audio_by_cache_key(db: Session, cache_key: str) -> Optional[models.Audio]:
+    return db.query(models.Audio).filter(
+        models.Audio.cache_key == cache_key,
+        models.Audio.status == models.AudioStatus.COMPLETED
+    ).order_by(models.Audio.id.desc()).first()
+
+def create_audio(db: Session, audio: schemas.AudioCreate, cache_key: Optional[str] = None) -> models.Audio:
     db_audio = models.Audio(
         user_email=audio.user_email,
         text_input=audio.text_input,
         voice_name=audio.voice_name,
         language_code=audio.language_code,
-        audio_format=audio.audio_format
+        audio_format=audio.audio_format,
+        cache_key=cache_key
     )
     db.add(db_audio)
     db.commit()
@@ -76,8 +124,10 @@ def create_audio(db: Session, audio: schemas.AudioCreate) -> models.Audio:
 
 def update_audio(db: Session, audio_id: int, audio_update: schemas.AudioUpdate) -> Optional[models.Audio]:
     db_audio = db.query(models.Audio).filter(models.Audio.id == audio_id).first()
+    with _audio_download_cache_lock:
+        _audio_download_cache.pop(audio_id, None)
     if db_audio:
-        update_data = audio_update.dict(exclude_unset=True)
+        update_data = audio_update.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_audio, field, value)
         db.commit()
@@ -93,6 +143,17 @@ def create_file(db: Session, file_data: dict) -> models.File:
     db.refresh(db_file)
     return db_file
 
+def create_files(db: Session, files_data: List[dict]) -> List[int]:
+    """Create several file records with one batched INSERT ... RETURNING; returns their ids in input order"""
+    if not files_data:
+        return []
+    file_ids = db.scalars(
+        insert(models.File).returning(models.File.id, sort_by_parameter_order=True),
+        files_data
+    ).all()
+    db.commit()
+    return list(file_ids)
+
 def get_file(db: Session, file_id: int) -> Optional[models.File]:
     """Get file by ID"""
     return db.query(models.File).filter(models.File.id == file_id).first()
@@ -113,11 +174,42 @@ def get_files_by_category(db: Session, category: models.FileCategory, skip: int
     """Get files by category"""
     return db.query(models.File).filter(models.File.category == category).offset(skip).limit(limit).all()
 
+def get_files_page(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    user_email: Optional[str] = None,
+    category: Optional[models.FileCategory] = None,
+    after_id: Optional[int] = None
+) -> Tuple[List[models.File], Optional[int]]:
+    """Get a page of files and the total matching count in one query"""
+    query = db.query(models.File, func.count().over().label("total"))
+    if user_email:
+        query = query.filter(models.File.user_email == user_email)
+    if category:
+        query = query.filter(models.File.category == category)
+    return _fetch_page(query, models.File, skip, limit, after_id)
+
+def _fetch_page(query, model, skip: int, limit: int, after_id: Optional[int] = None) -> Tuple[list, Optional[int]]:
+    """Run a `(model, COUNT(*) OVER ())` query and split it into the page rows and the total"""
+    if after_id is not None:
+        # Keyset pages seek past the cursor on the primary key and skip the count,
+        # which the client already has from the first page
+        rows = query.with_entities(model).filter(model.id > after_id).order_by(model.id).limit(limit).all()
+        return rows, None
+    # Offset pages use the keyset order too, so the X-Next-Cursor they send is valid
+    rows = query.order_by(model.id).offset(skip).limit(limit).all()
+    if rows:
+        return [row[0] for row in rows], rows[0][1]
+    # Past the last page the window has no rows to report on, so count directly
+    total = query.with_entities(func.count(model.id)).scalar() if skip else 0
+    return [], total
+
 def update_file(db: Session, file_id: int, file_update: schemas.FileUpdate) -> Optional[models.File]:
     """Update file record"""
     db_file = db.query(models.File).filter(models.File.id == file_id).first()
     if db_file:
-        update_data = file_update.dict(exclude_unset=True)
+        update_data = file_update.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_file, field, value)
         db.commit()
@@ -133,6 +225,16 @@ def update_file_download_count(db: Session, file_id: int) -> Optional[models.Fil
         db.refresh(db_file)
     return db_file
 
+def increment_file_download_counts(db: Session, counts: Dict[int, int]) -> None:
+    """Add buffered download counts to several files in one UPDATE"""
+    if not counts:
+        return
+    db.query(models.File).filter(models.File.id.in_(list(counts))).update(
+        {models.File.download_count: models.File.download_count + case(counts, value=models.File.id, else_=0)},
+        synchronize_session=False
+    )
+    db.commit()
+
 def delete_file(db: Session, file_id: int) -> bool:
     """Delete file record"""
     db_file = db.query(models.File).filter(models.File.id == file_id).first()
@@ -169,6 +271,10 @@ def get_video_session(db: Session, session_id: int) -> Optional[models.VideoSess
     """Get video session by ID"""
     return db.query(models.VideoSession).filter(models.VideoSession.id == session_id).first()
 
+def video_session_exists(db: Session, session_id: int) -> bool:
+    """Check whether a video session exists without loading the row"""
+    return db.query(db.query(models.VideoSession.id).filter(models.VideoSession.id == session_id).exists()).scalar()
+
 def get_video_sessions_by_user(db: Session, user_id: int, skip: int = 0, limit: int = 100) -> List[models.VideoSession]:
     """Get video sessions by user ID"""
     return db.query(models.VideoSession).filter(models.VideoSession.user_id == user_id).offset(skip).limit(limit).all()
@@ -181,13 +287,22 @@ def update_video_session(db: Session, session_id: int, session_update: schemas.V
     """Update video session"""
     db_session = db.query(models.VideoSession).filter(models.VideoSession.id == session_id).first()
     if db_session:
-        update_data = session_update.dict(exclude_unset=True)
+        update_data = session_update.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_session, field, value)
         db.commit()
         db.refresh(db_session)
     return db_session
 
+def increment_session_file_count(db: Session, session_id: int, delta: int) -> bool:
+    """Atomically add delta to a session's total_files; returns False if the session doesn't exist"""
+    updated = db.query(models.VideoSession).filter(models.VideoSession.id == session_id).update(
+        {models.VideoSession.total_files: func.coalesce(models.VideoSession.total_files, 0) + delta},
+        synchronize_session=False
+    )
+    db.commit()
+    return updated > 0
+
 def delete_video_session(db: Session, session_id: int) -> bool:
     """Delete video session"""
     db_session = db.query(models.VideoSession).filter(models.VideoSession.id == session_id).first()
@@ -197,6 +312,13 @@ def delete_video_session(db: Session, session_id: int) -> bool:
         return True
     return False
 
+def get_video_sessions_page(db: Session, skip: int = 0, limit: int = 100, user_id: Optional[int] = None, after_id: Optional[int] = None) -> Tuple[List[models.VideoSession], Optional[int]]:
+    """Get a page of video sessions and the total matching count in one query"""
+    query = db.query(models.VideoSession, func.count().over().label("total"))
+    if user_id:
+        query = query.filter(models.VideoSession.user_id == user_id)
+    return _fetch_page(query, models.VideoSession, skip, limit, after_id)
+
 def get_video_sessions_count(db: Session) -> int:
     """Get total count of video sessions"""
     return db.query(models.VideoSession).count()
@@ -205,10 +327,48 @@ def get_video_sessions_count_by_user(db: Session, user_id: int) -> int:
     """Get count of video sessions by user"""
     return db.query(models.VideoSession).filter(models.VideoSession.user_id == user_id).count()
 
-def get_files_by_video_session(db: Session, session_id: int, skip: int = 0, limit: int = 100) -> List[models.File]:
-    """Get files associated with a video session"""
-    return db.query(models.File).filter(models.File.video_session_id == session_id).offset(skip).limit(limit).all()
+def get_files_by_video_session(
+    db: Session,
+    session_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    content_type_prefix: Optional[str] = None
+) -> List[models.File]:
+    """Get files associated with a video session, optionally only those whose content type starts with a prefix"""
+    query = db.query(models.File).filter(models.File.video_session_id == session_id)
+    if content_type_prefix:
+        query = query.filter(models.File.content_type.startswith(content_type_prefix, autoescape=True))
+    return query.offset(skip).limit(limit).all()
+
+def get_files_page_by_video_session(db: Session, session_id: int, skip: int = 0, limit: int = 100, after_id: Optional[int] = None) -> Tuple[List[models.File], Optional[int]]:
+    """Get a page of a video session's files and their total count in one query"""
+    query = db.query(models.File, func.count().over().label("total")).filter(models.File.video_session_id == session_id)
+    return _fetch_page(query, models.File, skip, limit, after_id)
 
 def get_files_count_by_video_session(db: Session, session_id: int) -> int:
     """Get count of files in a video session"""
-    return db.query(models.File).filter(models.File.video_session_id == session_id).count()
\ No newline at end of file
+    return db.query(models.File).filter(models.File.video_session_id == session_id).count()
+
+# Processing Task CRUD Operations
+def create_processing_task(db: Session, task_type: str) -> models.ProcessingTask:
+    """Create a queued processing task record"""
+    db_task = models.ProcessingTask(id=uuid.uuid4().hex, task_type=task_type)
+    db.add(db_task)
+    db.commit()
+    db.refresh(db_task)
+    return db_task
+
+def get_processing_task(db: Session, task_id: str) -> Optional[models.ProcessingTask]:
+    """Get processing task by ID"""
+    return db.query(models.ProcessingTask).filter(models.ProcessingTask.id == task_id).first()
+
+def update_processing_task(db: Session, task_id: str, task_update: schemas.ProcessingTaskUpdate) -> Optional[models.ProcessingTask]:
+    """Update processing task status"""
+    db_task = db.query(models.ProcessingTask).filter(models.ProcessingTask.id == task_id).first()
+    if db_task:
+        update_data = task_update.model_dump(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(db_task, field, value)
+        db.commit()
+        db.refresh(db_task)
+    return db_task
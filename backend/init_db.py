@@ -0,0 +1,15 @@
+"""
+Create database tables once, e.g. as a deploy step, so app workers can
+start with CREATE_TABLES=false
+"""
+
+import models
+from database import engine
+
+def init_db():
+    """Create all tables that don't exist yet"""
+    models.Base.metadata.create_all(bind=engine)
+
+if __name__ == "__main__":
+    init_db()
+    print("Database tables created")
@@ -33,6 +33,12 @@ class VideoSessionStatus(enum.Enum):
     COMPLETED = "completed"
     FAILED = "failed"
 
+class ProcessingTaskStatus(enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
 class VideoCategory(enum.Enum):
     CONGRATULATION_VIDEO = "congratulation_video"
     EVENT_PROPAGATION_VIDEO = "event_propagation_video" 
@@ -70,6 +76,8 @@ class Audio(Base):
     file_path = Column(String, nullable=True)
     file_size = Column(Integer, nullable=True)
     duration = Column(Integer, nullable=True)
+    # SHA-256 of the synthesis inputs; rows with the same key can share one file
+    cache_key = Column(String, index=True, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -101,7 +109,7 @@ class File(Base):
     bucket_name = Column(String, nullable=False)
     file_size = Column(Integer, nullable=False)
     content_type = Column(String, nullable=False)
-    category = Column(Enum(FileCategory), nullable=False)
+    category = Column(Enum(FileCategory), nullable=False, index=True)  # Entries carry the rowid, so also covers category + id
     status = Column(Enum(FileStatus), index=True, default=FileStatus.UPLOADING)
     public_url = Column(String, nullable=True)
     gcs_path = Column(String, nullable=False)  # Full GCS path
@@ -110,4 +118,15 @@ class File(Base):
     tags = Column(String, nullable=True)  # JSON string of tags
     download_count = Column(Integer, default=0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+class ProcessingTask(Base):
+    __tablename__ = "processing_tasks"
+
+    id = Column(String, primary_key=True, index=True)  # UUID handed back to the client for polling
+    task_type = Column(String, nullable=False)  # e.g. "Video merge"
+    status = Column(Enum(ProcessingTaskStatus), index=True, default=ProcessingTaskStatus.QUEUED)
+    output_path = Column(String, nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -1,7 +1,7 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, TypeAdapter
 from datetime import datetime
-from typing import Optional, List
-from models import VideoStatus, AudioStatus, FileCategory, FileStatus, VideoSessionStatus, VideoCategory
+from typing import Any, Dict, Iterable, Optional, List, Type, TypeVar
+from models import VideoStatus, AudioStatus, FileCategory, FileStatus, VideoSessionStatus, VideoCategory, ProcessingTaskStatus
 
 # User Schemas
 class UserBase(BaseModel):
@@ -14,8 +14,7 @@ class User(UserBase):
     id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Video Schemas
 class VideoBase(BaseModel):
@@ -36,8 +35,7 @@ class Video(VideoBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Audio Schemas
 class AudioBase(BaseModel):
@@ -65,8 +63,7 @@ class Audio(AudioBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # File Schemas
 class FileBase(BaseModel):
@@ -121,13 +118,13 @@ class File(FileBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class FileList(BaseModel):
     files: List[File]
-    total: int
-    page: int
+    # Left unset on keyset (after_id) pages
+    total: Optional[int] = None
+    page: Optional[int] = None
     per_page: int
 
 # Video Session Schemas
@@ -162,11 +159,66 @@ class VideoSession(VideoSessionBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class VideoSessionList(BaseModel):
     sessions: List[VideoSession]
-    total: int
-    page: int
-    per_page: int
\ No newline at end of file
+    # Left unset on keyset (after_id) pages
+    total: Optional[int] = None
+    page: Optional[int] = None
+    per_page: int
+
+# Processing Task Schemas
+class ProcessingTaskUpdate(BaseModel):
+    status: Optional[ProcessingTaskStatus] = None
+    output_path: Optional[str] = None
+    error: Optional[str] = None
+
+class ProcessingTask(BaseModel):
+    id: str
+    task_type: str
+    status: ProcessingTaskStatus
+    output_path: Optional[str] = None
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+# Response helpers
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+def construct_from_orm(model: Type[ModelT], obj: Any) -> ModelT:
+    """Build a response model from a trusted ORM row without re-validating it"""
+    return model.model_construct(**{name: getattr(obj, name) for name in model.model_fields})
+
+def construct_list_from_orm(model: Type[ModelT], rows: Iterable[Any]) -> List[ModelT]:
+    """Build response models for a list of trusted ORM rows"""
+    return [construct_from_orm(model, row) for row in rows]
+
+def dump_orm_json(model: Type[ModelT], obj: Any) -> str:
+    """Serialize a single trusted ORM row to JSON without validating it"""
+    return construct_from_orm(model, obj).model_dump_json()
+
+# Built at import so the first list request doesn't pay for schema compilation
+_list_adapters: Dict[type, TypeAdapter] = {model: TypeAdapter(List[model]) for model in (User, Video, Audio)}
+
+def dump_orm_list_json(model: Type[ModelT], rows: Iterable[Any]) -> bytes:
+    """Serialize trusted ORM rows straight to JSON bytes in a single pydantic-core pass"""
+    adapter = _list_adapters.get(model)
+    if adapter is None:
+        adapter = _list_adapters[model] = TypeAdapter(List[model])
+    return adapter.dump_json(construct_list_from_orm(model, rows))
+
+def dump_orm_page_json(model: Type[ModelT], items_field: str, item_model: Type[BaseModel], rows: Iterable[Any], **fields: Any) -> str:
+    """Serialize a paginated list response (FileList, VideoSessionList) built from trusted ORM rows"""
+    page = model.model_construct(**{items_field: construct_list_from_orm(item_model, rows)}, **fields)
+    return page.model_dump_json()
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def next_cursor_headers(rows, limit: int) -> Dict[str, str]:
+    """Cursor for the next keyset page, or no header when this page is the last one"""
+    if rows and len(rows) >= limit:
+        return {NEXT_CURSOR_HEADER: str(rows[-1].id)}
+    return {}